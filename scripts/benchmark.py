@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script
+Measures startup and throughput costs of the Project Hampton helper scripts
+"""
+
+import copy
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+import click
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Sample code for the single-code lookup path
+SAMPLE_CODE = 'HAMPTON-TICT-W1M1-KZCJ-EYJW'
+
+# Heavy modules each script must not import at load time
+STARTUP_FORBIDDEN = {
+    'progress_analyzer': ['pandas', 'numpy', 'matplotlib', 'seaborn'],
+    'content_validator': ['jsonschema'],
+    'content_generator': ['jinja2'],
+}
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse `python -X importtime` output into (module, cumulative us, depth) rows."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        # Nested imports are indented two spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(cumulative_us), depth))
+    return imports
+
+def measure_imports(module: str) -> Dict:
+    """Import a script module in a fresh interpreter with -X importtime."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise click.ClickException(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    imports = parse_importtime(result.stderr)
+    loaded = {name.split('.')[0] for name, _, _ in imports}
+    direct = [(name, us) for name, us, depth in imports if depth == 1]
+    return {
+        'total_ms': sum(us for _, us, depth in imports if depth == 0) / 1000,
+        'top': sorted(direct, key=lambda item: -item[1])[:5],
+        'forbidden': sorted(set(STARTUP_FORBIDDEN.get(module, [])) & loaded)
+    }
+
+def synthetic_curriculum(count: int) -> List[Dict]:
+    """Week documents cloned from content/week1, with every tenth one made invalid."""
+    with open(SCRIPTS_DIR.parent / 'content' / 'week1' / 'modules.json', 'r', encoding='utf-8') as f:
+        template = json.load(f)
+
+    documents = []
+    for i in range(count):
+        week = i % 8 + 1
+        document = copy.deepcopy(template)
+        document['week'] = week
+        for number, module in enumerate(document['modules'], 1):
+            module['id'] = f"w{week}m{number}"
+            module['xp'] = (i + number) * 10
+        if i % 10 == 9:
+            document['modules'][0]['difficulty'] = 'expert'
+            del document['description']
+        documents.append(document)
+    return documents
+
+def time_command(args: List[str], runs: int, cwd: Path = SCRIPTS_DIR) -> float:
+    """Best-of-N wall-clock time of a command, in milliseconds."""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=cwd, capture_output=True)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+def command_imports(args: List[str], cwd: Path = SCRIPTS_DIR) -> set:
+    """Top-level modules a Python command imports, from -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=cwd, capture_output=True, text=True)
+    return {name.split('.')[0] for name, _, _ in parse_importtime(result.stderr)}
+
+@click.group()
+def cli():
+    """Benchmark Project Hampton helper scripts."""
+
+@cli.command()
+@click.option('--budget-ms', type=float, default=250, show_default=True,
+              help='Maximum wall-clock time for a single-code lookup or report')
+@click.option('--runs', type=int, default=5, show_default=True, help='Runs per measurement (best is kept)')
+def startup(budget_ms, runs):
+    """Guard script startup time and the single-code lookup and report budget."""
+    failed = False
+
+    click.echo("⏱  Import cost per script (python -X importtime)")
+    for module in STARTUP_FORBIDDEN:
+        stats = measure_imports(module)
+        click.echo(f"\n  {module}: {stats['total_ms']:.1f} ms")
+        for name, us in stats['top']:
+            click.echo(f"    {name:<30} {us / 1000:7.1f} ms")
+        if stats['forbidden']:
+            failed = True
+            click.echo(f"  ✗ Loads heavy modules at startup: {', '.join(stats['forbidden'])}", err=True)
+
+    # The report also exports JSON under data/, so run in a scratch directory
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, options in (('Single-code lookup', ['-c', SAMPLE_CODE]),
+                               ('Single-code report', ['-c', SAMPLE_CODE, '-r'])):
+            args = [str(SCRIPTS_DIR / 'progress_analyzer.py'), *options]
+            lookup_ms = time_command([sys.executable, *args], runs, cwd=workdir)
+            click.echo(f"\n🔎 {label}: {lookup_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+            if lookup_ms > budget_ms:
+                failed = True
+                click.echo("  ✗ Over budget", err=True)
+            forbidden = sorted(set(STARTUP_FORBIDDEN['progress_analyzer']) & command_imports(args, cwd=workdir))
+            if forbidden:
+                failed = True
+                click.echo(f"  ✗ Loads heavy modules: {', '.join(forbidden)}", err=True)
+
+    if failed:
+        sys.exit(1)
+    click.echo("\n✅ Startup within budget")
+
+@cli.command()
+@click.option('--files', type=int, default=2000, show_default=True, help='Synthetic week documents to validate')
+def schema(files):
+    """Compare per-call jsonschema.validate with the compiled content validator."""
+    from jsonschema import validate, ValidationError
+    from content_validator import ContentValidator
+
+    documents = synthetic_curriculum(files)
+    validator = ContentValidator()
+    schema_doc = validator.module_schema
+
+    start = time.perf_counter()
+    first_errors = 0
+    for document in documents:
+        try:
+            validate(instance=document, schema=schema_doc)
+        except ValidationError:
+            first_errors += 1
+    per_call = time.perf_counter() - start
+
+    start = time.perf_counter()
+    all_errors = sum(len(list(validator.schema_validator.iter_errors(document))) for document in documents)
+    compiled = time.perf_counter() - start
+
+    click.echo(f"📐 Schema validation over {files} synthetic week files")
+    click.echo(f"  jsonschema.validate per call: {per_call * 1e6 / files:8.1f} us/file ({first_errors} files failed, first error only)")
+    click.echo(f"  compiled validator:           {compiled * 1e6 / files:8.1f} us/file ({all_errors} errors reported)")
+    click.echo(f"  Speedup: {per_call / compiled:.1f}x")
+
+@cli.command()
+@click.option('--weeks', type=int, default=96, show_default=True, help='Generated weeks to save per variant')
+def save(weeks):
+    """Compare per-week save cost of the content generator's output formats."""
+    import yaml
+    from content_generator import ContentGenerator, PROJECT_TYPES, WEEKS, YAML_DUMPER
+    
+    generator = ContentGenerator(str(SCRIPTS_DIR / 'config.yaml'))
+    combinations = [(week, project_type) for project_type in PROJECT_TYPES for week in WEEKS]
+    contents = [(week, project_type, generator.generate_week_structure(week, project_type))
+                for week, project_type in (combinations[i % len(combinations)] for i in range(weeks))]
+    
+    def pure_python_save(week, content, project_type):
+        week_dir = generator.content_dir / f"week{week}"
+        week_dir.mkdir(parents=True, exist_ok=True)
+        with open(week_dir / f"modules_{project_type}.json", 'w') as f:
+            json.dump(content, f, indent=2)
+        with open(week_dir / f"modules_{project_type}.yaml", 'w') as f:
+            yaml.dump(content, f, default_flow_style=False)
+    
+    variants = [
+        ('json + yaml, pure-Python emitter', ('json', 'yaml'), pure_python_save),
+        (f'json + yaml, {YAML_DUMPER.__name__}', ('json', 'yaml'), generator.save_week_content),
+        ('json only (--formats json)', ('json',), generator.save_week_content),
+    ]
+    
+    click.echo(f"💾 Saving {weeks} generated weeks")
+    baseline = None
+    for label, formats, save_week in variants:
+        with tempfile.TemporaryDirectory() as tmp:
+            generator.content_dir = Path(tmp)
+            generator.formats = formats
+            start = time.perf_counter()
+            for week, project_type, content in contents:
+                save_week(week, content, project_type)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        click.echo(f"  {label:<34} {elapsed * 1000 / weeks:7.2f} ms/week ({baseline / elapsed:.1f}x)")
+
+if __name__ == "__main__":
+    cli()
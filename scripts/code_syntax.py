@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Code Syntax Checks
+Syntax checking for code examples embedded in Project Hampton course content
+"""
+
+import ast
+import hashlib
+import json
+import re
+import textwrap
+from typing import Dict, Iterable, List, Optional, Tuple
+
+LANGUAGE_ALIASES = {
+    'py': 'python', 'python3': 'python',
+    'js': 'javascript', 'node': 'javascript', 'mjs': 'javascript',
+    'htm': 'html', 'xhtml': 'html',
+}
+
+PYTHON_HINT = re.compile(r'^\s*(def \w+\(|class \w+.*:\s*$|import \w|from [\w.]+ import |print\(|if __name__)', re.M)
+JS_HINT = re.compile(r'\bfunction\b|=>|\b(const|let|var)\s+[\w$]|console\.|document\.|;\s*$|^\s*//', re.M)
+# A tag or fragment where an expression is expected. JSX is left unchecked:
+# telling its markup from comparisons and regex literals takes a real parser.
+JSX_HINT = re.compile(r'(?:\breturn|=>|[=(,?:&|])\s*<[A-Za-z>]')
+CSS_RULES = re.compile(r'(?:\s*(?:/\*.*?\*/\s*)*[^{}();]+\{(?:\s*[\w-]+\s*:[^;{}]+;?)*\s*\})+\s*', re.S)
+JSON_START = re.compile(r'[\[{]\s*("|[\[{\]}])')
+
+OPENERS = {'(': ')', '[': ']', '{': '}'}
+CLOSERS = {')': '(', ']': '[', '}': '{'}
+# A '/' after one of these starts a regular expression literal rather than a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'in', 'of', 'delete', 'void', 'throw', 'new', 'else', 'do'}
+
+HTML_TOKEN = re.compile(
+    r'<!--.*?-->|<!\[CDATA\[.*?\]\]>|<![^>]*>'
+    r'|<(/?)([A-Za-z][\w:-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>',
+    re.S
+)
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+}
+# Elements whose end tag may be left out
+OPTIONAL_CLOSE = {
+    'p', 'li', 'dt', 'dd', 'tr', 'td', 'th', 'thead', 'tbody', 'tfoot',
+    'option', 'optgroup', 'colgroup', 'caption', 'rt', 'rp', 'html', 'head', 'body'
+}
+
+def detect_language(code: str) -> Optional[str]:
+    """Best guess at a snippet's language, or None for prose."""
+    text = code.strip()
+    if not text:
+        return None
+    if text.startswith('<'):
+        return 'html'
+    if JSON_START.match(text):
+        return 'json'
+    if PYTHON_HINT.search(text) and not JS_HINT.search(text):
+        return 'python'
+    if JS_HINT.search(text):
+        return 'jsx' if JSX_HINT.search(text) else 'javascript'
+    if CSS_RULES.fullmatch(text):
+        return 'css'
+    return None
+
+def check_python(code: str) -> List[str]:
+    try:
+        ast.parse(textwrap.dedent(code))
+    except SyntaxError as e:
+        return [f"Python syntax error at line {e.lineno}: {e.msg}"]
+    except ValueError as e:
+        return [f"Python syntax error: {e}"]
+    return []
+
+def check_json(code: str) -> List[str]:
+    try:
+        json.loads(code)
+    except json.JSONDecodeError as e:
+        return [f"JSON syntax error at line {e.lineno}: {e.msg}"]
+    return []
+
+def scan_brackets(code: str, line_comments: bool = True, regex_literals: bool = True,
+                  template_literals: bool = True) -> List[str]:
+    """Stack-based tokenizer matching brackets outside strings, comments and regex literals.
+
+    Template literals and their ${...} expressions are tracked on the same
+    stack, so nesting across them is checked too. Stops at the first problem.
+    """
+    stack: List[Tuple[str, int]] = []  # (opener, line)
+    i, n, line = 0, len(code), 1
+    prev, prev_word = '', ''
+
+    while i < n:
+        c = code[i]
+
+        # Inside a template literal: only the closing backtick or ${ matter
+        if stack and stack[-1][0] == '`':
+            if c == '\\':
+                i += 2
+            elif c == '`':
+                stack.pop()
+                i += 1
+                prev, prev_word = 'a', ''
+            elif code.startswith('${', i):
+                stack.append(('${', line))
+                i += 2
+                prev, prev_word = '(', ''
+            else:
+                line += c == '\n'
+                i += 1
+            continue
+
+        if c == '\n':
+            line += 1
+            i += 1
+        elif c in ' \t\r':
+            i += 1
+        elif code.startswith('/*', i):
+            end = code.find('*/', i + 2)
+            if end < 0:
+                return [f"Unterminated comment at line {line}"]
+            line += code.count('\n', i, end)
+            i = end + 2
+        elif line_comments and code.startswith('//', i):
+            end = code.find('\n', i)
+            i = n if end < 0 else end
+        elif c in '"\'':
+            j = i + 1
+            while j < n and code[j] != c and code[j] != '\n':
+                j += 2 if code[j] == '\\' else 1
+            if j >= n or code[j] != c:
+                return [f"Unterminated string at line {line}"]
+            i = j + 1
+            prev, prev_word = 'a', ''
+        elif c == '`' and template_literals:
+            stack.append(('`', line))
+            i += 1
+        elif c == '/' and regex_literals and (prev in REGEX_PRECEDERS or prev == '' or prev_word in REGEX_KEYWORDS):
+            j, in_class = i + 1, False
+            while j < n and code[j] != '\n' and (in_class or code[j] != '/'):
+                if code[j] == '\\':
+                    j += 1
+                elif code[j] == '[':
+                    in_class = True
+                elif code[j] == ']':
+                    in_class = False
+                j += 1
+            if j >= n or code[j] != '/':
+                return [f"Unterminated regular expression at line {line}"]
+            i = j + 1
+            prev, prev_word = 'a', ''
+        elif code.startswith('++', i) or code.startswith('--', i):
+            # Ends an operand when postfix, and prefix ++/-- can't precede a
+            # regex, so a following '/' is a division either way
+            i += 2
+            prev, prev_word = 'a', ''
+        elif c.isalnum() or c in '_$':
+            j = i + 1
+            while j < n and (code[j].isalnum() or code[j] in '_$'):
+                j += 1
+            prev, prev_word = 'a', code[i:j]
+            i = j
+        else:
+            if c in OPENERS:
+                stack.append((c, line))
+            elif c in CLOSERS:
+                expected = ('{', '${') if c == '}' else (CLOSERS[c],)
+                if not stack or stack[-1][0] not in expected:
+                    return [f"Unexpected '{c}' at line {line}"]
+                stack.pop()
+            prev, prev_word = c, ''
+            i += 1
+
+    if stack:
+        opener, opened_at = stack[-1]
+        if opener == '`':
+            return [f"Unterminated template literal from line {opened_at}"]
+        return [f"Unclosed '{opener[-1]}' from line {opened_at}"]
+    return []
+
+def check_javascript(code: str) -> List[str]:
+    return scan_brackets(code)
+
+def check_css(code: str) -> List[str]:
+    return scan_brackets(code, line_comments=False, regex_literals=False, template_literals=False)
+
+def check_html(code: str) -> List[str]:
+    """Match start and end tags, and check inline <script> and <style> bodies."""
+    stack: List[Tuple[str, int]] = []  # (tag, line)
+    position = 0
+
+    while True:
+        match = HTML_TOKEN.search(code, position)
+        if match is None:
+            break
+        position = match.end()
+        closing, name, attributes = match.group(1), match.group(2), match.group(3)
+        if name is None:
+            continue  # Comment, doctype or CDATA
+        name = name.lower()
+        line = code.count('\n', 0, match.start()) + 1
+
+        if not closing:
+            if name in VOID_ELEMENTS or attributes.rstrip().endswith('/'):
+                continue
+            if name in ('script', 'style'):
+                end = code.lower().find(f'</{name}', position)
+                if end < 0:
+                    return [f"Unclosed <{name}> from line {line}"]
+                body = code[position:end]
+                issues = check_javascript(body) if name == 'script' else check_css(body)
+                if issues:
+                    return [f"In <{name}> from line {line}: {issues[0]}"]
+                # Resume at the end tag, which closes this element as usual
+                stack.append((name, line))
+                position = end
+                continue
+            stack.append((name, line))
+            continue
+
+        if not any(tag == name for tag, _ in stack):
+            return [f"Unexpected </{name}> at line {line}"]
+        while stack[-1][0] != name:
+            tag, opened_at = stack.pop()
+            if tag not in OPTIONAL_CLOSE:
+                return [f"Unclosed <{tag}> from line {opened_at}"]
+        stack.pop()
+
+    for tag, opened_at in reversed(stack):
+        if tag not in OPTIONAL_CLOSE:
+            return [f"Unclosed <{tag}> from line {opened_at}"]
+    return []
+
+CHECKERS = {
+    'python': check_python,
+    'json': check_json,
+    'javascript': check_javascript,
+    'css': check_css,
+    'html': check_html,
+}
+
+# (language, snippet digest) -> issues; shared by every check in the process
+_memo: Dict[Tuple[str, bytes], Tuple[str, ...]] = {}
+_memo_stats = {'hits': 0, 'misses': 0}
+
+def check_snippet(code: str, language: Optional[str] = None) -> List[str]:
+    """Syntax issues in a snippet, memoized by its hash so repeats are checked once."""
+    if language:
+        language = LANGUAGE_ALIASES.get(language.lower(), language.lower())
+    else:
+        language = detect_language(code)
+    checker = CHECKERS.get(language)
+    if checker is None:
+        return []
+
+    key = (language, hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest())
+    if key in _memo:
+        _memo_stats['hits'] += 1
+    else:
+        _memo_stats['misses'] += 1
+        _memo[key] = tuple(checker(code))
+    return list(_memo[key])
+
+def check_snippets(snippets: Iterable[Tuple[str, Optional[str]]]) -> List[List[str]]:
+    """Check a batch of (code, language) snippets, returning issues in the same order."""
+    return [check_snippet(code, language) for code, language in snippets]
+
+def memo_info() -> Dict[str, int]:
+    return {'hits': _memo_stats['hits'], 'misses': _memo_stats['misses'], 'size': len(_memo)}
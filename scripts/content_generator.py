@@ -4,25 +4,219 @@ Content Generator Script
 Generates course content templates and structure for Project Hampton
 """
 
+import hashlib
 import json
 import os
 import sys
+import time
+from contextlib import ExitStack
 from pathlib import Path
 import click
 import yaml
-from jinja2 import Template
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+PROJECT_TYPES = ['dashboard', 'blog', 'automation']
+WEEKS = range(1, 9)
+STAGES = ('generate', 'serialize', 'write')
+FORMATS = ('json', 'yaml')
+OUTPUT_FORMATS = ('json', 'yaml', 'jsonl')
+# Formats a week can be written in module by module
+STREAM_FORMATS = ('json', 'jsonl')
+
+# Modules whose templates are rendered together; bounds rendered text held while streaming
+MODULE_BATCH = 64
+
+# libyaml's emitter when PyYAML was built with it; same output, several times faster
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def file_digest(path) -> str:
+    """sha256 of a file, read in chunks so large outputs are never held whole."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def exercise_count(module: int) -> int:
+    """2 exercises per module, 3 for the weekly project module."""
+    return 2 if module < 5 else 3
+
+def text_lines(text: str) -> List[str]:
+    """Non-blank lines of a rendered block, for list fields authored one item per line."""
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+@lru_cache(maxsize=None)
+def template_environment(templates_dir: str, cache_dir: str):
+    """One Jinja2 environment per templates directory, so each template is compiled once.
+    
+    Compiled templates are also kept on disk, so later runs and worker
+    processes load bytecode instead of parsing the sources again.
+    """
+    # jinja2 is only needed once content is actually generated
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
+    
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        undefined=StrictUndefined,
+        auto_reload=False
+    )
+
+class OutputFile:
+    """Writable text handle that leaves the file alone if its content would not change.
+    
+    Writes are compared with the existing file as they arrive. At the first
+    difference the matching prefix is copied to a temporary file, which
+    replaces the original on close, so serializers can stream straight
+    into it without either version being held in memory.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.existing = open(self.path, 'rb')
+        except FileNotFoundError:
+            self.existing = None
+        self.matched = 0
+        self.file = None
+        self.changed = False
+        self.sha256 = hashlib.sha256()
+    
+    @property
+    def digest(self) -> str:
+        """sha256 of everything written, for the generation manifest."""
+        return self.sha256.hexdigest()
+    
+    def write(self, text: str):
+        data = text.encode('utf-8')
+        self.sha256.update(data)
+        if self.file is None:
+            if self.existing is not None and self.existing.read(len(data)) == data:
+                self.matched += len(data)
+                return
+            self._open()
+        self.file.write(data)
+    
+    def _open(self):
+        self.file = open(self.temp_path, 'wb')
+        if self.existing is not None:
+            self.existing.seek(0)
+            remaining = self.matched
+            while remaining:
+                chunk = self.existing.read(min(remaining, 1 << 16))
+                self.file.write(chunk)
+                remaining -= len(chunk)
+            self.existing.close()
+    
+    def close(self):
+        # A new file, or new content that is a strict prefix of the old
+        if self.file is None and (self.existing is None or self.existing.read(1)):
+            self._open()
+        if self.existing is not None:
+            self.existing.close()
+        if self.file is not None:
+            self.file.close()
+            os.replace(self.temp_path, self.path)
+            self.changed = True
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        # Leave the original untouched if serializing failed
+        if self.existing is not None:
+            self.existing.close()
+        if self.file is not None:
+            self.file.close()
+            self.temp_path.unlink()
+
+class GenerationManifest:
+    """Record of the inputs a generation ran with and the outputs it produced.
+    
+    A week whose inputs hash matches and whose recorded outputs are still on
+    disk unchanged does not need to be generated again.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.inputs_hash = None
+        self.tasks: Dict[str, List[str]] = {}  # Task key -> output paths
+        self.outputs: Dict[str, str] = {}  # Output path -> sha256 of its text
+        
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    manifest = json.load(f)
+                self.inputs_hash = manifest['inputs_hash']
+                self.tasks = manifest['tasks']
+                self.outputs = manifest['outputs']
+            except (json.JSONDecodeError, KeyError, OSError):
+                pass  # A corrupt manifest just means regenerating
+    
+    def is_current(self, task: str, inputs_hash: str) -> bool:
+        """Whether a task's outputs were produced from these inputs and are untouched since."""
+        if inputs_hash != self.inputs_hash or task not in self.tasks:
+            return False
+        for path in self.tasks[task]:
+            try:
+                if file_digest(path) != self.outputs.get(path):
+                    return False
+            except OSError:
+                return False
+        return True
+    
+    def record(self, task: str, inputs_hash: str, outputs: Dict[Path, str]):
+        """Record a task's output paths and their sha256 digests."""
+        if inputs_hash != self.inputs_hash:
+            # Outputs of other inputs can't make any task current again
+            self.inputs_hash, self.tasks, self.outputs = inputs_hash, {}, {}
+        self.tasks[task] = [str(path) for path in outputs]
+        self.outputs.update((str(path), digest) for path, digest in outputs.items())
+    
+    def save(self):
+        # Only keep hashes of outputs some task still produces
+        produced = {path for paths in self.tasks.values() for path in paths}
+        self.outputs = {path: digest for path, digest in self.outputs.items() if path in produced}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'inputs_hash': self.inputs_hash, 'tasks': self.tasks, 'outputs': self.outputs},
+                      f, indent=2, sort_keys=True)
+
+@lru_cache(maxsize=None)
+def _worker_generator(config_path: str, formats: Tuple[str, ...]) -> 'ContentGenerator':
+    """One generator per worker process, so the config is loaded once."""
+    return ContentGenerator(config_path, formats)
+
+def _render_week(config_path: str, formats: Tuple[str, ...], week: int, project_type: str,
+                 quiz: bool) -> Tuple[Dict[str, str], Dict[str, float]]:
+    """Render one week in a worker process."""
+    return _worker_generator(config_path, formats).render_week(week, project_type, quiz)
+
 class ContentGenerator:
-    def __init__(self, config_path: str = "scripts/config.yaml"):
+    def __init__(self, config_path: str = "scripts/config.yaml", formats: Tuple[str, ...] = FORMATS):
         """Initialize the content generator with configuration."""
+        self.config_path = config_path
+        self.formats = tuple(formats)
         self.config = self.load_config(config_path)
         self.content_dir = Path(self.config['paths']['content'])
-        self.templates_dir = Path("scripts/templates")
+        self.manifest = GenerationManifest(Path(self.config['paths'].get('data', 'data')) / 'generation_manifest.json')
+        self.write_stats = {'written': 0, 'unchanged': 0}
+        self.output_digests: Dict[Path, str] = {}  # Path -> sha256 of what this run wrote there
+        self.templates_dir = Path(__file__).resolve().parent / "templates"
+        self.template_cache_dir = Path(self.config['paths'].get('data', 'data')) / 'template_cache'
         
     def load_config(self, path: str) -> Dict:
         """Load configuration from YAML file."""
@@ -43,9 +237,33 @@ class ContentGenerator:
                 }
             }
     
-    def generate_week_structure(self, week: int, project_type: str = "dashboard") -> Dict:
+    def render_blocks(self, name: str, contexts: List[Dict]) -> List[Dict[str, str]]:
+        """Render every block of a template once per context, as stripped text keyed by block name."""
+        template = template_environment(str(self.templates_dir), str(self.template_cache_dir)).get_template(name)
+        rendered = []
+        for context in contexts:
+            template_context = template.new_context(context)
+            rendered.append({block: ''.join(render(template_context)).strip()
+                             for block, render in template.blocks.items()})
+        return rendered
+    
+    def generate_week_structure(self, week: int, project_type: str = "dashboard", module_count: int = 5) -> Dict:
         """Generate the structure for a week's content."""
         
+        week_data = self.week_header(week, project_type)
+        week_data["modules"] = list(self.iter_modules(week, project_type, module_count))
+        week_data["week_summary"] = self.week_summary(
+            week,
+            sum(m["xp"] for m in week_data["modules"]),
+            list(dict.fromkeys(skill for m in week_data["modules"] for skill in m["skills"])),
+            module_count
+        )
+        
+        return week_data
+    
+    def week_header(self, week: int, project_type: str) -> Dict:
+        """The week fields that precede its modules."""
+        
         week_titles = {
             1: "AI-Assisted Development Fundamentals",
             2: "Building the Foundation",
@@ -87,30 +305,64 @@ class ContentGenerator:
             }
         }
         
-        week_data = {
+        return {
             "week": week,
             "title": project_specifics.get(project_type, {}).get(week, week_titles.get(week, f"Week {week}")),
-            "description": f"Week {week} content for {project_type} project path",
-            "modules": []
+            "description": f"Week {week} content for {project_type} project path"
         }
+    
+    def iter_modules(self, week: int, project_type: str, module_count: int = 5) -> Iterator[Dict]:
+        """Generate a week's modules one at a time (5 per week by default).
+        
+        Templates are rendered for up to MODULE_BATCH modules at once, which
+        is the whole week unless it is very large.
+        """
+        for first in range(1, module_count + 1, MODULE_BATCH):
+            modules = range(first, min(first + MODULE_BATCH, module_count + 1))
+            for module_num, text in zip(modules, self.render_modules(week, modules, project_type)):
+                yield self.generate_module(week, module_num, project_type, text)
+    
+    def render_modules(self, week: int, modules: Iterable[int], project_type: str) -> List[Dict[str, Any]]:
+        """Render the module content, exercise and project templates for several modules of a week.
         
-        # Generate 5 modules per week
-        for module_num in range(1, 6):
-            module = self.generate_module(week, module_num, project_type)
-            week_data["modules"].append(module)
+        Each template is rendered in one call for all the modules using it.
+        Returns per module the 'content' and 'project' blocks and a list of
+        'exercises' blocks.
+        """
+        contexts = [{"week": week, "module": module, "topic": self.module_topic(module, project_type),
+                     "project_type": project_type} for module in modules]
         
-        week_data["week_summary"] = {
-            "total_xp": sum(m["xp"] for m in week_data["modules"]),
-            "skills_developed": list(set(skill for m in week_data["modules"] for skill in m["skills"])),
-            "projects_completed": 1 if module_num == 5 else 0,
+        contents = self.render_blocks("module_content.j2", contexts)
+        exercises = iter(self.render_blocks("exercise.j2", [
+            {"week": week, "module": context["module"], "topic": context["topic"], "number": i}
+            for context in contexts for i in range(1, exercise_count(context["module"]) + 1)
+        ]))
+        # Regular module projects, and the weekly integration project for module 5 onwards
+        projects = iter(self.render_blocks("project.j2", [c for c in contexts if c["module"] < 5]))
+        integration_projects = iter(self.render_blocks("integration_project.j2", [c for c in contexts if c["module"] >= 5]))
+        
+        return [
+            {
+                "content": content,
+                "exercises": [next(exercises) for _ in range(exercise_count(context["module"]))],
+                "project": next(projects if context["module"] < 5 else integration_projects)
+            }
+            for context, content in zip(contexts, contents)
+        ]
+    
+    def week_summary(self, week: int, total_xp: int, skills: List[str], module_count: int) -> Dict:
+        """The summary that follows a week's modules."""
+        return {
+            "total_xp": total_xp,
+            "skills_developed": skills,
+            # The integration project is module 5
+            "projects_completed": 1 if module_count >= 5 else 0,
             "estimated_time": f"{6 + week}-{8 + week} hours",
             "achievement_available": f"Week {week} Warrior"
         }
-        
-        return week_data
     
-    def generate_module(self, week: int, module: int, project_type: str) -> Dict:
-        """Generate a single module structure."""
+    def module_topic(self, module: int, project_type: str) -> str:
+        """A module's topic for the project type."""
         
         # Module topics based on week and project type
         module_topics = {
@@ -125,6 +377,12 @@ class ContentGenerator:
             ]
         }
         
+        topics = module_topics.get(project_type, module_topics["dashboard"])
+        return topics[module - 1] if module <= len(topics) else f"Module {module}"
+    
+    def generate_module(self, week: int, module: int, project_type: str, text: Optional[Dict[str, Any]] = None) -> Dict:
+        """Generate a single module structure, from its render_modules text if already rendered."""
+        
         skills_map = {
             1: ["ai_prompting", "git"],
             2: ["html", "css"],
@@ -136,8 +394,9 @@ class ContentGenerator:
             8: ["deployment", "monitoring"]
         }
         
-        topics = module_topics.get(project_type, module_topics["dashboard"])
-        topic = topics[module - 1] if module <= len(topics) else f"Module {module}"
+        topic = self.module_topic(module, project_type)
+        if text is None:
+            text = self.render_modules(week, [module], project_type)[0]
         
         return {
             "id": f"w{week}m{module}",
@@ -153,131 +412,291 @@ class ContentGenerator:
                 "Practice with hands-on exercises",
                 "Build toward weekly project"
             ],
-            "content": self.generate_module_content(week, module, topic, project_type)
+            "content": self.generate_module_content(week, module, topic, project_type, text)
         }
     
-    def generate_module_content(self, week: int, module: int, topic: str, project_type: str) -> Dict:
-        """Generate the actual content for a module."""
+    def generate_module_content(self, week: int, module: int, topic: str, project_type: str,
+                                text: Dict[str, Any]) -> Dict:
+        """Generate the actual content for a module from its rendered templates (see render_modules)."""
+        
+        content = text["content"]
+        sections = [line.partition(": ") for line in text_lines(content["reading_sections"])]
         
         return {
-            "introduction": f"Welcome to Week {week}, Module {module}: {topic}. "
-                          f"In this module, we'll explore key concepts and build practical skills.",
+            "introduction": content["introduction"],
             "video": None,  # Placeholder for future video content
             "reading": {
-                "title": f"Understanding {topic}",
-                "sections": [
-                    {
-                        "heading": "Core Concepts",
-                        "content": f"Essential concepts for {topic} in {project_type} development..."
-                    },
-                    {
-                        "heading": "Best Practices",
-                        "content": f"Industry best practices for implementing {topic}..."
-                    },
-                    {
-                        "heading": "Common Pitfalls",
-                        "content": f"Avoid these common mistakes when working with {topic}..."
-                    }
-                ]
+                "title": content["reading_title"],
+                "sections": [{"heading": heading, "content": section} for heading, _, section in sections]
             },
-            "exercises": self.generate_exercises(week, module, topic),
-            "project": self.generate_project(week, module, topic, project_type)
+            "exercises": self.generate_exercises(week, module, topic, text["exercises"]),
+            "project": self.generate_project(week, module, topic, project_type, text["project"])
         }
     
-    def generate_exercises(self, week: int, module: int, topic: str) -> List[Dict]:
-        """Generate exercises for a module."""
-        
-        exercises = []
+    def generate_exercises(self, week: int, module: int, topic: str, texts: List[Dict[str, str]]) -> List[Dict]:
+        """Generate a module's 2-3 exercises from their rendered templates/exercise.j2 blocks."""
         
-        # Generate 2-3 exercises per module
-        num_exercises = 2 if module < 5 else 3
-        
-        for i in range(1, num_exercises + 1):
-            exercise = {
-                "title": f"{topic} Exercise {i}",
-                "description": f"Practice {topic.lower()} concepts with this hands-on exercise",
-                "hints": [
-                    f"Start by understanding the requirements",
-                    f"Use AI assistance to generate initial code",
-                    f"Test and refine your solution"
-                ],
-                "solution": f"// Solution for {topic} Exercise {i}",
+        return [
+            {
+                "title": text["title"],
+                "description": text["description"],
+                "hints": text_lines(text["hints"]),
+                "solution": text["solution"],
                 "xp": 25 + (week * 5)
             }
-            exercises.append(exercise)
-        
-        return exercises
+            for text in texts
+        ]
     
-    def generate_project(self, week: int, module: int, topic: str, project_type: str) -> Dict:
-        """Generate project requirements for a module."""
+    def generate_project(self, week: int, module: int, topic: str, project_type: str, text: Dict[str, str]) -> Dict:
+        """Generate project requirements for a module from its rendered templates/project.j2 blocks.
         
-        if module < 5:
-            # Regular module project
-            return {
-                "title": f"{topic} Implementation",
-                "description": f"Apply what you've learned about {topic} to your {project_type} project",
-                "requirements": [
-                    f"Implement {topic.lower()} functionality",
-                    "Follow best practices",
-                    "Test your implementation",
-                    "Document your code"
-                ],
-                "starter_prompts": [
-                    f"Help me implement {topic.lower()}",
-                    f"Review my {topic.lower()} code",
-                    f"Suggest improvements for {topic.lower()}"
-                ],
-                "xp": 50 + (week * 10)
-            }
+        The last module of a week gets the weekly integration project instead.
+        """
+        
+        # Regular module project, or the weekly culmination project
+        xp = 50 + (week * 10) if module < 5 else 150 + (week * 20)
+        
+        return {
+            "title": text["title"],
+            "description": text["description"],
+            "requirements": text_lines(text["requirements"]),
+            "starter_prompts": text_lines(text["starter_prompts"]),
+            "xp": xp
+        }
+    
+    def dump_week(self, content: Dict, fmt: str, stream=None):
+        """Serialize week content in one format, to `stream` or as a string."""
+        if fmt in ('json', 'jsonl'):
+            if fmt == 'json':
+                text = json.dumps(content, indent=2)
+            else:
+                # One module per line
+                text = ''.join(json.dumps(module) + '\n' for module in content['modules'])
+            if stream is None:
+                return text
+            stream.write(text)
         else:
-            # Weekly culmination project
-            return {
-                "title": f"Week {week} Integration Project",
-                "description": f"Combine everything from Week {week} into a cohesive feature",
-                "requirements": [
-                    "Integrate all week's modules",
-                    "Ensure code quality",
-                    "Add polish and refinements",
-                    "Prepare for next week"
-                ],
-                "starter_prompts": [
-                    f"Help me integrate Week {week} features",
-                    "Review my weekly project",
-                    "Suggest final improvements"
-                ],
-                "xp": 150 + (week * 20)
-            }
+            # YAML mirror for easier editing
+            return yaml.dump(content, stream, Dumper=YAML_DUMPER, default_flow_style=False)
+    
+    def serialize_week(self, content: Dict) -> Dict[str, str]:
+        """Serialize week content in each configured format."""
+        return {fmt: self.dump_week(content, fmt) for fmt in self.formats}
     
-    def save_week_content(self, week: int, content: Dict, project_type: str = "dashboard"):
-        """Save generated week content to file."""
+    def save_week_content(self, week: int, content: Dict, project_type: str = "dashboard") -> List[Path]:
+        """Save generated week content to file, one per configured format."""
         
         week_dir = self.content_dir / f"week{week}"
         week_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save as JSON
-        json_path = week_dir / f"modules_{project_type}.json"
-        with open(json_path, 'w') as f:
-            json.dump(content, f, indent=2)
+        paths = []
+        for fmt in self.formats:
+            path = week_dir / f"modules_{project_type}.{fmt}"
+            with OutputFile(path) as f:
+                self.dump_week(content, fmt, f)
+            self.count_output(path, f)
+            paths.append(path)
+        
+        return paths
+    
+    def write_week_stream(self, week: int, header: Dict, modules: Iterable[Dict], streams: Dict[str, Any]) -> int:
+        """Serialize a week into each stream as its modules arrive, returning the module count.
+        
+        The json stream gets the same bytes as json.dumps(indent=2) of the
+        whole week and the jsonl stream one module per line, but only the
+        current module and running summary totals are ever held.
+        """
+        json_out, jsonl_out = streams.get('json'), streams.get('jsonl')
+        if json_out:
+            # Header object without its closing brace, then the open modules array
+            json_out.write(json.dumps(header, indent=2)[:-2] + ',\n  "modules": [')
         
-        # Also save as YAML for easier editing
-        yaml_path = week_dir / f"modules_{project_type}.yaml"
-        with open(yaml_path, 'w') as f:
-            yaml.dump(content, f, default_flow_style=False)
+        count, total_xp, skills = 0, 0, {}
+        for module in modules:
+            if json_out:
+                json_out.write((',\n' if count else '\n') + '    ' + json.dumps(module, indent=2).replace('\n', '\n    '))
+            if jsonl_out:
+                jsonl_out.write(json.dumps(module) + '\n')
+            count += 1
+            total_xp += module["xp"]
+            skills.update(dict.fromkeys(module["skills"]))
         
-        return json_path, yaml_path
+        if json_out:
+            summary = self.week_summary(week, total_xp, list(skills), count)
+            json_out.write(('\n  ]' if count else ']') + ',\n  "week_summary": '
+                           + json.dumps(summary, indent=2).replace('\n', '\n  ') + '\n}')
+        return count
     
-    def generate_all_weeks(self, project_type: str = "dashboard"):
-        """Generate content for all 8 weeks."""
+    def stream_week_content(self, week: int, project_type: str = "dashboard", module_count: int = 5) -> List[Path]:
+        """Generate and save a week module by module, so peak memory is one module rather than the week.
+        
+        Output matches save_week_content; only the json and jsonl formats can
+        be streamed.
+        """
+        unsupported = [fmt for fmt in self.formats if fmt not in STREAM_FORMATS]
+        if unsupported:
+            raise ValueError(f"Cannot stream {', '.join(unsupported)}; use {' or '.join(STREAM_FORMATS)}")
+        
+        week_dir = self.content_dir / f"week{week}"
+        week_dir.mkdir(parents=True, exist_ok=True)
+        paths = [week_dir / f"modules_{project_type}.{fmt}" for fmt in self.formats]
+        
+        with ExitStack() as stack:
+            streams = {fmt: stack.enter_context(OutputFile(path)) for fmt, path in zip(self.formats, paths)}
+            self.write_week_stream(week, self.week_header(week, project_type),
+                                   self.iter_modules(week, project_type, module_count), streams)
+        for path, output in zip(paths, streams.values()):
+            self.count_output(path, output)
+        
+        return paths
+    
+    def render_week(self, week: int, project_type: str, quiz: bool = False) -> Tuple[Dict[str, str], Dict[str, float]]:
+        """Generate and serialize one week without writing it.
+        
+        Returns output text keyed by path relative to the content directory,
+        and the seconds spent generating and serializing.
+        """
+        start = time.perf_counter()
+        content = self.generate_week_structure(week, project_type)
+        generated = time.perf_counter()
+        
+        outputs = {f"week{week}/modules_{project_type}.{fmt}": text
+                   for fmt, text in self.serialize_week(content).items()}
+        if quiz:
+            outputs.update(self.quiz_outputs(week))
+        
+        return outputs, {'generate': generated - start, 'serialize': time.perf_counter() - generated}
+    
+    def inputs_hash(self) -> str:
+        """Hash of everything generated content depends on: the config, this script and the templates."""
+        digest = hashlib.sha256()
+        try:
+            with open(self.config_path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(json.dumps(self.config, sort_keys=True).encode('utf-8'))
+        digest.update(Path(__file__).read_bytes())
+        for template in sorted(self.templates_dir.glob('*.j2')):
+            digest.update(template.name.encode('utf-8'))
+            digest.update(template.read_bytes())
+        return digest.hexdigest()
+    
+    def write_outputs(self, outputs: Dict[Path, str]):
+        """Write a batch of files, creating each directory once.
+        
+        Files whose current content is already identical are left alone, so
+        their mtimes don't change and downstream rebuilds aren't triggered.
+        """
+        for directory in sorted({Path(path).parent for path in outputs}):
+            directory.mkdir(parents=True, exist_ok=True)
+        for path, text in outputs.items():
+            with OutputFile(path) as f:
+                f.write(text)
+            self.count_output(path, f)
+    
+    def count_output(self, path: Path, output: OutputFile):
+        self.write_stats['written' if output.changed else 'unchanged'] += 1
+        self.output_digests[Path(path)] = output.digest
+    
+    def task_key(self, week: int, project_type: str, quiz: bool = False, module_count: int = 5) -> str:
+        """Manifest key for a week's outputs in the current content directory and formats."""
+        variant = '+'.join(self.formats) + (f'+{module_count}modules' if module_count != 5 else '')
+        return f"{self.content_dir}/{project_type}/week{week}/{variant}{'+quiz' if quiz else ''}"
+    
+    def quiz_outputs(self, week: int) -> Dict[str, str]:
+        """A week's quiz files, keyed by path relative to the content directory."""
+        return {f"week{week}/quiz_m{module}.json": json.dumps(self.generate_quiz_questions(week, module), indent=2)
+                for module in range(1, 6)}
+    
+    def generate_week(self, week: int, project_type: str = "dashboard", module_count: int = 5,
+                      quiz: bool = False, stream: bool = False, force: bool = False,
+                      inputs_hash: Optional[str] = None) -> Optional[List[Path]]:
+        """Generate and save one week, and its quizzes, unless the manifest shows it current.
+        
+        Returns the paths saved, or None if the week was skipped. The
+        manifest is updated in memory; callers save it once they are done.
+        """
+        inputs_hash = inputs_hash or self.inputs_hash()
+        task = self.task_key(week, project_type, quiz, module_count)
+        if not force and self.manifest.is_current(task, inputs_hash):
+            return None
+        
+        if stream:
+            paths = self.stream_week_content(week, project_type, module_count)
+        else:
+            content = self.generate_week_structure(week, project_type, module_count)
+            paths = self.save_week_content(week, content, project_type)
+        if quiz:
+            quizzes = {self.content_dir / relative_path: text for relative_path, text in self.quiz_outputs(week).items()}
+            self.write_outputs(quizzes)
+            paths += list(quizzes)
+        
+        self.manifest.record(task, inputs_hash, {path: self.output_digests[path] for path in paths})
+        return paths
+    
+    def generate_matrix(self, project_types: List[str], weeks=WEEKS, quiz: bool = False,
+                        jobs: int = 1, force: bool = False) -> Tuple[List[Path], Dict[str, float]]:
+        """Generate every project × week combination, on up to `jobs` processes.
+        
+        Weeks are rendered in workers and written in one batch by this
+        process, in the same order as a serial run, so output is identical
+        whatever the job count. Weeks the manifest shows as current are
+        skipped unless force. Returns the rendered paths and per-stage
+        seconds (generate and serialize summed over all weeks).
+        """
+        start = time.perf_counter()
+        inputs_hash = self.inputs_hash()
+        tasks = [(week, project_type) for project_type in project_types for week in weeks
+                 if force or not self.manifest.is_current(self.task_key(week, project_type, quiz), inputs_hash)]
+        
+        if jobs <= 1:
+            rendered = [self.render_week(week, project_type, quiz) for week, project_type in tasks]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [pool.submit(_render_week, self.config_path, self.formats, week, project_type, quiz)
+                           for week, project_type in tasks]
+                rendered = [future.result() for future in futures]
+        
+        timings = {stage: 0.0 for stage in STAGES}
+        outputs = {}
+        for (week, project_type), (week_outputs, week_timings) in zip(tasks, rendered):
+            for stage, seconds in week_timings.items():
+                timings[stage] += seconds
+            task_outputs = {self.content_dir / relative_path: text for relative_path, text in week_outputs.items()}
+            self.manifest.record(self.task_key(week, project_type, quiz), inputs_hash,
+                                 {path: text_digest(text) for path, text in task_outputs.items()})
+            outputs.update(task_outputs)
+        
+        write_start = time.perf_counter()
+        self.write_outputs(outputs)
+        if tasks:
+            self.manifest.save()
+        timings['write'] = time.perf_counter() - write_start
+        timings['total'] = time.perf_counter() - start
+        timings['skipped_weeks'] = len(project_types) * len(weeks) - len(tasks)
+        return list(outputs), timings
+    
+    def generate_all_weeks(self, project_type: str = "dashboard", module_count: int = 5, stream: bool = False,
+                           force: bool = False):
+        """Generate content for all 8 weeks, skipping weeks the manifest shows current unless force."""
         
         generated_files = []
+        inputs_hash = self.inputs_hash()
         
         for week in range(1, 9):
             click.echo(f"Generating Week {week} content for {project_type}...")
-            content = self.generate_week_structure(week, project_type)
-            json_path, yaml_path = self.save_week_content(week, content, project_type)
-            generated_files.append((json_path, yaml_path))
-            click.echo(f"  ✓ Saved to {json_path} and {yaml_path}")
+            paths = self.generate_week(week, project_type, module_count, stream=stream, force=force,
+                                       inputs_hash=inputs_hash)
+            if paths is None:
+                click.echo("  ✓ Already current")
+                continue
+            generated_files.append(paths)
+            click.echo(f"  ✓ Saved to {' and '.join(map(str, paths))}")
         
+        if generated_files:
+            self.manifest.save()
         return generated_files
     
     def generate_quiz_questions(self, week: int, module: int, num_questions: int = 5) -> List[Dict]:
@@ -302,43 +721,67 @@ class ContentGenerator:
         
         return questions
 
+def parse_formats(ctx, param, value) -> Tuple[str, ...]:
+    formats = tuple(dict.fromkeys(fmt.strip().lower() for fmt in value.split(',') if fmt.strip()))
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+    if unknown or not formats:
+        raise click.BadParameter(f"expected a comma-separated list of {', '.join(OUTPUT_FORMATS)}")
+    return formats
+
 @click.command()
 @click.option('--week', '-w', type=int, help='Generate content for specific week (1-8)')
-@click.option('--project', '-p', type=click.Choice(['dashboard', 'blog', 'automation']), 
+@click.option('--project', '-p', type=click.Choice(PROJECT_TYPES), 
               default='dashboard', help='Project type')
 @click.option('--all-weeks', is_flag=True, help='Generate content for all weeks')
 @click.option('--quiz', is_flag=True, help='Generate quiz questions')
 @click.option('--output', '-o', help='Output directory')
-def main(week, project, all_weeks, quiz, output):
+@click.option('--all-projects', is_flag=True, help='Generate all weeks for every project type')
+@click.option('--jobs', '-j', type=int, default=1, show_default=True,
+              help='Worker processes for --all-projects')
+@click.option('--force', is_flag=True, help='Regenerate weeks even if the manifest shows them current')
+@click.option('--formats', default=','.join(FORMATS), show_default=True, callback=parse_formats,
+              help='Week file formats to write (the YAML mirror is optional)')
+@click.option('--modules', 'module_count', type=click.IntRange(min=1), default=5, show_default=True,
+              help='Modules per week for --week and --all-weeks')
+@click.option('--stream', is_flag=True,
+              help='Write --week/--all-weeks output module by module (json and jsonl formats only)')
+def main(week, project, all_weeks, quiz, output, all_projects, jobs, force, formats, module_count, stream):
     """Generate course content for Project Hampton."""
     
-    generator = ContentGenerator()
+    if stream and not set(formats) <= set(STREAM_FORMATS):
+        raise click.UsageError(f"--stream supports only the {' and '.join(STREAM_FORMATS)} formats")
+    if all_projects and (stream or module_count != 5):
+        # generate_matrix renders whole five-module weeks in worker processes
+        raise click.UsageError("--stream and --modules apply to --week and --all-weeks, not --all-projects")
+    
+    generator = ContentGenerator(formats=formats)
     
     if output:
         generator.content_dir = Path(output)
     
     click.echo(f"🚀 Project Hampton Content Generator v{generator.config['project']['version']}")
     
-    if all_weeks:
+    if all_projects:
+        click.echo(f"\nGenerating all weeks for {', '.join(PROJECT_TYPES)} on {jobs} process(es)...")
+        files, timings = generator.generate_matrix(PROJECT_TYPES, quiz=quiz, jobs=jobs, force=force)
+        click.echo(f"\n✅ Rendered {len(files)} files in {timings['total']:.2f}s: "
+                   f"{generator.write_stats['written']} written, {generator.write_stats['unchanged']} unchanged, "
+                   f"{timings['skipped_weeks']} weeks already current")
+        click.echo("⏱  " + " · ".join(f"{stage} {timings[stage]:.2f}s" for stage in STAGES))
+    elif all_weeks:
         click.echo(f"\nGenerating all weeks for {project} project...")
-        files = generator.generate_all_weeks(project)
+        files = generator.generate_all_weeks(project, module_count, stream, force)
         click.echo(f"\n✅ Generated {len(files)} week files!")
     elif week:
         click.echo(f"\nGenerating Week {week} content for {project} project...")
-        content = generator.generate_week_structure(week, project)
-        json_path, yaml_path = generator.save_week_content(week, content, project)
-        click.echo(f"✅ Saved to:\n  - {json_path}\n  - {yaml_path}")
-        
-        if quiz:
-            click.echo(f"\nGenerating quiz questions...")
-            for module in range(1, 6):
-                questions = generator.generate_quiz_questions(week, module)
-                quiz_path = generator.content_dir / f"week{week}" / f"quiz_m{module}.json"
-                with open(quiz_path, 'w') as f:
-                    json.dump(questions, f, indent=2)
-                click.echo(f"  ✓ Module {module}: {len(questions)} questions")
+        paths = generator.generate_week(week, project, module_count, quiz, stream, force)
+        if paths is None:
+            click.echo("✅ Already current (use --force to regenerate)")
+        else:
+            generator.manifest.save()
+            click.echo("✅ Saved to:\n" + "\n".join(f"  - {path}" for path in paths))
     else:
-        click.echo("Please specify --week or --all-weeks")
+        click.echo("Please specify --week, --all-weeks or --all-projects")
         click.echo("Use --help for more options")
 
 if __name__ == "__main__":
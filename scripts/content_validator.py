@@ -4,27 +4,496 @@ Content Validator Script
 Validates course content structure and completeness for Project Hampton
 """
 
+import hashlib
 import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import click
-import yaml
-from jsonschema import validate, ValidationError
 import re
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from code_syntax import check_snippets
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Bump when a check changes so cached results are not reused
+VALIDATOR_VERSION = 6
+
+# Rule ids attached to every reported issue
+RULES = {
+    'json-parse': 'File is not readable, valid JSON',
+    'schema': 'Week module file violates the module schema',
+    'curriculum-shape': 'Curriculum node is missing a field or has the wrong type',
+    'curriculum-xp': 'Curriculum day XP does not add up to total_xp',
+    'curriculum-days': 'Curriculum day count differs from the schedule',
+    'malformed-link': 'Link has no host',
+    'broken-link': 'Link did not respond successfully',
+    'code-syntax': 'Code example has a syntax error',
+    'missing-week': 'Week directory or module file is missing',
+    'progression': 'Difficulty does not progress across weeks',
+    'xp-mismatch': 'Week XP differs from its week_summary',
+    'xp-balance': 'Week XP is far from the average',
+    'skills-coverage': 'Required skill is taught rarely or never',
+    'check-failed': 'A check could not read the data it needs',
+}
+
+# Watchdog event types that mean a file's content may have changed
+WRITE_EVENTS = {'created', 'modified', 'moved', 'deleted', 'closed'}
+
+# Required file first, then the per-project variants
+WEEK_FILES = ['modules.json', 'modules_dashboard.json', 'modules_blog.json', 'modules_automation.json']
+
+REQUIRED_SKILLS = [
+    'ai_prompting', 'git', 'html', 'css', 'javascript',
+    'debugging', 'deployment', 'databases'
+]
+
+def summarize_week(data: Any) -> Dict:
+    """Per-file facts the cross-week checks need, small enough to cache.
+    
+    A failing lookup is kept as its message, so the aggregate checks can
+    report it exactly as if they had read the document themselves.
+    """
+    summary = {}
+    try:
+        summary['difficulties'] = [m['difficulty'] for m in data.get('modules', [])]
+    except Exception as e:
+        summary['difficulties_error'] = str(e)
+    try:
+        summary['xp'] = sum(m.get('xp', 0) for m in data.get('modules', []))
+        summary['summary_xp'] = data.get('week_summary', {}).get('total_xp', 0)
+    except Exception as e:
+        summary['xp_error'] = str(e)
+    summary['skills'] = []
+    try:
+        for module in data.get('modules', []):
+            for skill in module.get('skills', []):
+                if skill in REQUIRED_SKILLS:
+                    summary['skills'].append([skill, module['number']])
+    except Exception as e:
+        summary['skills_error'] = str(e)
+    return summary
+
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+CODE_KEYS = ('code', 'solution', 'example')
+
+# Required fields and their types for each node of a project curriculum
+CURRICULUM_FIELDS = {
+    'weeks': {'project': str, 'description': str, 'weeks': dict},
+    'days': {'title': str, 'description': str, 'days': dict},
+    'projects': {'projects': dict},
+    'week': {'title': str, 'description': str, 'modules': list},
+    'module': {'title': str, 'topics': list},
+    'project': {'title': str, 'days': dict},
+    'day': {'title': str, 'lessons': list, 'deliverable': str, 'xp': int},
+}
+
+def finding(rule: str, message: str, pointer: str = '') -> Dict:
+    """One issue within a file, as kept in per-file (and cached) results."""
+    return {'rule': rule, 'pointer': pointer, 'message': message}
+
+def is_curriculum_file(file_path: Path) -> bool:
+    return Path(file_path).name.startswith('curriculum')
+
+def json_pointer(path: Tuple) -> str:
+    """RFC 6901 pointer for a key path, '' for the document root."""
+    return ''.join('/' + str(part).replace('~', '~0').replace('/', '~1') for part in path)
+
+class NodePath:
+    """Key path of a node, linked to its parent so a deep walk stays linear.
+    
+    parts() builds the full tuple only when a finding needs a location.
+    """
+    __slots__ = ('parent', 'key', 'depth')
+    
+    def __init__(self, parent: Optional['NodePath'] = None, key: Any = None):
+        self.parent = parent
+        self.key = key
+        self.depth = parent.depth + 1 if parent is not None else 0
+    
+    def parts(self) -> Tuple:
+        parts = []
+        node = self
+        while node.depth:
+            parts.append(node.key)
+            node = node.parent
+        return tuple(reversed(parts))
+
+def walk(document: Any):
+    """Yield (NodePath, value) for every node, depth-first in document order, without recursion."""
+    stack = [(NodePath(), document)]
+    while stack:
+        path, value = stack.pop()
+        yield path, value
+        if isinstance(value, dict):
+            stack.extend((NodePath(path, key), child) for key, child in reversed(value.items()))
+        elif isinstance(value, list):
+            stack.extend((NodePath(path, i), child) for i, child in reversed(list(enumerate(value))))
+
+def scan_node(path: NodePath, value: Any):
+    """Yield ('url', path, url, None) for links in a string node and
+    ('code', path, code, language) for code blocks held by a dict node."""
+    if isinstance(value, str):
+        for url in URL_PATTERN.findall(value):
+            yield 'url', path, url, None
+    elif isinstance(value, dict):
+        language = value.get('language')
+        language = language if isinstance(language, str) else None
+        for key in CODE_KEYS:
+            code = value.get(key)
+            if isinstance(code, str) and code.strip():
+                yield 'code', NodePath(path, key), code, language
+
+def scan_content(document: Any):
+    """Yield every link and code block in a document from a single walk."""
+    for path, value in walk(document):
+        yield from scan_node(path, value)
+
+def is_malformed_url(url: str) -> bool:
+    return not urlsplit(url).netloc
+
+class ContentFindings:
+    """Links and code blocks gathered during a walk.
+    
+    Code blocks are syntax-checked together once the walk is done, so
+    repeated snippets hit the checker's memo instead of being re-parsed.
+    """
+    
+    def __init__(self, source: Path, errors: List[Dict], warnings: List[Dict]):
+        self.source = source
+        self.errors = errors
+        self.warnings = warnings
+        self.urls = set()
+        self.code_blocks: List[Tuple[NodePath, str, Optional[str]]] = []
+    
+    def add(self, kind: str, path: NodePath, value: str, language: Optional[str]):
+        if kind == 'url':
+            self.urls.add(value)
+            if is_malformed_url(value):
+                pointer = json_pointer(path.parts())
+                self.errors.append(finding('malformed-link', f"Malformed link in {self.source} at "
+                                                             f"{pointer or '/'}: {value}", pointer))
+        else:
+            self.code_blocks.append((path, value, language))
+    
+    def finish(self):
+        issues = check_snippets((code, language) for _, code, language in self.code_blocks)
+        for (path, _, _), block_issues in zip(self.code_blocks, issues):
+            pointer = json_pointer(path.parts())
+            for issue in block_issues:
+                self.warnings.append(finding('code-syntax', f"Code example in {self.source} at "
+                                                            f"{pointer or '/'}: {issue}", pointer))
+
+def location(path: Tuple) -> str:
+    """JSON pointer for messages, with '/' standing for the document root."""
+    return json_pointer(path) or '/'
+
+def curriculum_role(layout: str, node: NodePath) -> Optional[str]:
+    """Which curriculum node, if any, sits at a path for the given layout."""
+    depth = node.depth
+    if depth == 0:
+        return layout
+    if depth > 4:
+        return None
+    path = node.parts()
+    if layout == 'weeks' and path[0] == 'weeks':
+        if depth == 2:
+            return 'week'
+        if depth == 4 and path[2] == 'modules':
+            return 'module'
+    elif layout == 'days' and path[0] == 'days' and depth == 2:
+        return 'day'
+    elif layout == 'projects' and path[0] == 'projects':
+        if depth == 2:
+            return 'project'
+        if depth == 4 and path[2] == 'days':
+            return 'day'
+    return None
+
+def check_curriculum(document: Any, source: Path) -> Dict:
+    """Validate a weeks → modules or (projects →) days curriculum in one walk.
+    
+    Shape, XP totals, links and code-block balance are all checked from the
+    same traversal, so cost grows with the size of the content only.
+    """
+    errors, warnings = [], []
+    if not isinstance(document, dict):
+        return {'errors': [finding('curriculum-shape', f"Curriculum error in {source}: expected an object")],
+                'warnings': [], 'urls': [], 'summary': None}
+    layout = next((key for key in ('weeks', 'projects', 'days') if key in document), None)
+    if layout is None:
+        return {'errors': [finding('curriculum-shape', f"Curriculum error in {source}: no weeks, days or projects")],
+                'warnings': [], 'urls': [], 'summary': None}
+    
+    xp_totals: Dict[Tuple, int] = {}  # Scope path -> summed day XP
+    declared_xp: Dict[Tuple, Any] = {}  # Scope path -> total_xp field
+    day_counts: Dict[Tuple, int] = {}
+    findings = ContentFindings(source, errors, warnings)
+    
+    for node, value in walk(document):
+        for item in scan_node(node, value):
+            findings.add(*item)
+        if isinstance(value, str):
+            continue
+        
+        role = curriculum_role(layout, node)
+        if role is None:
+            continue
+        path = node.parts()
+        if not isinstance(value, dict):
+            errors.append(finding('curriculum-shape', f"Curriculum error in {source} at {location(path)}: "
+                                                      f"{role} should be an object", json_pointer(path)))
+            continue
+        
+        for field, field_type in CURRICULUM_FIELDS[role].items():
+            if field not in value:
+                errors.append(finding('curriculum-shape', f"Curriculum error in {source} at {location(path)}: "
+                                                          f"missing '{field}'", json_pointer(path)))
+            elif not isinstance(value[field], field_type) or isinstance(value[field], bool):
+                errors.append(finding('curriculum-shape', f"Curriculum error in {source} at {location(path + (field,))}: "
+                                                          f"should be {field_type.__name__}", json_pointer(path + (field,))))
+        
+        if role in ('days', 'project'):
+            declared_xp[path] = value.get('total_xp')
+            xp_totals.setdefault(path, 0)
+            day_counts[path] = len(value['days']) if isinstance(value.get('days'), dict) else 0
+        elif role == 'day' and isinstance(value.get('xp'), int):
+            if value['xp'] < 0:
+                errors.append(finding('curriculum-shape', f"Curriculum error in {source} at {location(path + ('xp',))}: "
+                                                          f"negative XP", json_pointer(path + ('xp',))))
+            scope = path[:-2]
+            xp_totals[scope] = xp_totals.get(scope, 0) + value['xp']
+    
+    findings.finish()
+    for scope, total in xp_totals.items():
+        declared = declared_xp.get(scope)
+        if declared is not None and declared != total:
+            warnings.append(finding('curriculum-xp', f"XP mismatch in {source} at {location(scope)}: "
+                                                     f"days sum to {total}, total_xp={declared}", json_pointer(scope)))
+    
+    total_days = document.get('schedule', {}).get('total_days') if isinstance(document.get('schedule'), dict) else None
+    if total_days is not None:
+        for scope, count in day_counts.items():
+            if count != total_days:
+                warnings.append(finding('curriculum-days', f"{source} at {location(scope)}: "
+                                                           f"{count} days, schedule says {total_days}", json_pointer(scope)))
+    
+    return {
+        'errors': errors,
+        'warnings': warnings,
+        'urls': sorted(findings.urls),
+        'summary': {
+            'layout': layout,
+            'xp': {json_pointer(scope): total for scope, total in xp_totals.items()}
+        }
+    }
+
+class ValidationCache:
+    """Per-file validation results keyed by path and content hash.
+    
+    Entries are dropped wholesale when the validator version or schema
+    changes, so a hit is always safe to reuse.
+    """
+    
+    def __init__(self, cache_path: Path, version: str):
+        self.cache_path = Path(cache_path)
+        self.version = version
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('version') == version:
+                    self.entries = cached['entries']
+            except (json.JSONDecodeError, KeyError, OSError):
+                pass  # A corrupt cache is just rebuilt
+    
+    def lookup(self, file_path: Path, digest: Optional[str]) -> Optional[Dict]:
+        """Cached result for an unchanged file, or None."""
+        entry = self.entries.get(str(file_path))
+        if digest is not None and entry and entry['hash'] == digest:
+            self.hits += 1
+            return entry['result']
+        self.misses += 1
+        return None
+    
+    def store(self, file_path: Path, digest: Optional[str], result: Dict):
+        if digest is None:
+            return
+        self.entries[str(file_path)] = {'hash': digest, 'result': result}
+        self.dirty = True
+    
+    def save(self):
+        """Write the cache back, forgetting files that no longer exist."""
+        if not self.dirty:
+            return
+        self.entries = {path: entry for path, entry in self.entries.items() if Path(path).exists()}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w') as f:
+            json.dump({'version': self.version, 'entries': self.entries}, f, indent=2)
+        self.dirty = False
+
+class ContentIndex:
+    """Parsed content files, each read and parsed at most once.
+    
+    Every validation check reads documents through the index, so a full
+    run parses each file a single time.
+    """
+    
+    def __init__(self, content_dir: Path):
+        self.content_dir = Path(content_dir)
+        self.documents: Dict[Path, Any] = {}
+        self.load_errors: Dict[Path, str] = {}
+        self.digests: Dict[Path, str] = {}
+        self._raw: Dict[Path, bytes] = {}  # Bytes read for hashing, awaiting parse
+    
+    def digest(self, file_path: Path) -> Optional[str]:
+        """sha256 of the file's bytes, or None if it cannot be read."""
+        file_path = Path(file_path)
+        if file_path not in self.digests:
+            try:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                return None
+            self._raw[file_path] = raw
+            self.digests[file_path] = hashlib.sha256(raw).hexdigest()
+        return self.digests[file_path]
+    
+    def load(self, file_path: Path) -> Optional[Any]:
+        """Parse a JSON file, or return the cached document."""
+        file_path = Path(file_path)
+        if file_path in self.documents:
+            return self.documents[file_path]
+        if file_path in self.load_errors:
+            return None
+        
+        try:
+            raw = self._raw.pop(file_path, None)
+            if raw is None:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+            data = json.loads(raw.decode('utf-8'))
+        except json.JSONDecodeError as e:
+            self.load_errors[file_path] = f"JSON decode error in {file_path}: {e}"
+            return None
+        except Exception as e:
+            self.load_errors[file_path] = f"Error reading {file_path}: {e}"
+            return None
+        
+        self.documents[file_path] = data
+        return data
+    
+    def forget(self, file_path: Path):
+        """Drop a file's parsed document so the next load rereads it."""
+        file_path = Path(file_path)
+        for table in (self.documents, self.load_errors, self.digests, self._raw):
+            table.pop(file_path, None)
+    
+    def week_file(self, week: int) -> Path:
+        return self.content_dir / f"week{week}" / "modules.json"
+    
+    def week(self, week: int) -> Optional[Dict]:
+        """Parsed content/weekN/modules.json, or None if missing or unreadable."""
+        week_file = self.week_file(week)
+        if not week_file.exists():
+            return None
+        return self.load(week_file)
+
+@lru_cache(maxsize=None)
+def _worker_validator(content_dir: str) -> 'ContentValidator':
+    """One validator per worker process, so the schema is compiled once."""
+    return ContentValidator(content_dir)
+
+class JsonlSink:
+    """Write each issue as one JSON line as soon as it is found."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def emit(self, record: Dict):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+    
+    def close(self):
+        pass
+
+class SarifSink:
+    """Stream issues as a SARIF 2.1.0 log.
+    
+    The header and rule table are written up front and each result is
+    flushed as it arrives, so only close() is needed to finish the document.
+    """
+    
+    LEVELS = {'error': 'error', 'warning': 'warning'}
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.first = True
+        header = {
+            'version': '2.1.0',
+            '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+            'runs': [{
+                'tool': {'driver': {
+                    'name': 'content_validator',
+                    'rules': [{'id': rule, 'shortDescription': {'text': text}} for rule, text in RULES.items()]
+                }},
+                'results': []
+            }]
+        }
+        # Split the document where the results array opens
+        text = json.dumps(header, ensure_ascii=False)
+        self.head, self.tail = text.rsplit('"results": []', 1)
+        self.stream.write(self.head + '"results": [')
+        self.stream.flush()
+    
+    def emit(self, record: Dict):
+        result = {
+            'ruleId': record['rule'],
+            'level': self.LEVELS[record['severity']],
+            'message': {'text': record['message']}
+        }
+        if record['file']:
+            result['locations'] = [{
+                'physicalLocation': {'artifactLocation': {'uri': Path(record['file']).as_posix()}},
+                'logicalLocations': [{'fullyQualifiedName': record['pointer'] or '/', 'kind': 'element'}]
+            }]
+            result['properties'] = {'jsonPointer': record['pointer']}
+        self.stream.write(('' if self.first else ',') + "\n" + json.dumps(result, ensure_ascii=False))
+        self.stream.flush()
+        self.first = False
+    
+    def close(self):
+        self.stream.write("\n]" + self.tail + "\n")
+        self.stream.flush()
+
+def _check_file(content_dir: str, file_path: str) -> Tuple[Optional[str], Dict]:
+    """Check one file in a worker process, returning the digest of the bytes checked."""
+    validator = _worker_validator(content_dir)
+    validator.index = ContentIndex(validator.content_dir)
+    return validator.index.digest(file_path), validator.check_file(Path(file_path))
+
 class ContentValidator:
-    def __init__(self, content_dir: str = "content"):
-        """Initialize the content validator."""
+    def __init__(self, content_dir: str = "content", cache_path: Optional[str] = None,
+                 curriculum_dirs: Optional[List[str]] = None):
+        """Initialize the content validator, optionally with a persistent result cache."""
         self.content_dir = Path(content_dir)
+        self.curriculum_dirs = [Path(d) for d in curriculum_dirs] if curriculum_dirs else [self.content_dir]
+        self.index = ContentIndex(self.content_dir)
         self.errors = []
         self.warnings = []
         self.info = []
+        self.counts = {'error': 0, 'warning': 0, 'info': 0}
+        self.sink = None  # Streams each issue as found instead of keeping the messages
         
         # Define the schema for module content
         self.module_schema = {
@@ -66,25 +535,189 @@ class ContentValidator:
                 }
             }
         }
+        self._schema_validator = None
+        self._results: Dict[Path, Dict] = {}  # File -> {'errors', 'summary'} for this run ({'valid', ...} once streamed)
+        
+        self.cache = None
+        if cache_path:
+            schema_hash = hashlib.sha256(json.dumps(self.module_schema, sort_keys=True).encode()).hexdigest()
+            self.cache = ValidationCache(cache_path, f"{VALIDATOR_VERSION}-{schema_hash[:16]}")
+    
+    @property
+    def schema_validator(self):
+        """Validator for module_schema, checked and compiled once on first use."""
+        if self._schema_validator is None:
+            # jsonschema is slow to import, so only load it once validation runs
+            from jsonschema.validators import validator_for
+            
+            validator_class = validator_for(self.module_schema)
+            validator_class.check_schema(self.module_schema)
+            self._schema_validator = validator_class(self.module_schema)
+        return self._schema_validator
+    
+    def check_file(self, file_path: Path) -> Dict:
+        """Parse and check one file, returning its errors, warnings and summary."""
+        data = self.index.load(file_path)
+        if data is None:
+            return {'errors': [finding('json-parse', self.index.load_errors[Path(file_path)])],
+                    'warnings': [], 'urls': [], 'summary': None}
+        if is_curriculum_file(file_path):
+            return check_curriculum(data, file_path)
+        
+        errors, warnings = self._structure_errors(file_path), []
+        findings = ContentFindings(file_path, errors, warnings)
+        for item in scan_content(data):
+            findings.add(*item)
+        findings.finish()
+        return {
+            'errors': errors,
+            'warnings': warnings,
+            'urls': sorted(findings.urls),
+            'summary': summarize_week(data)
+        }
+    
+    def file_result(self, file_path: Path) -> Dict:
+        """Per-file result from this run, the cache, or a fresh check."""
+        file_path = Path(file_path)
+        if file_path not in self._results:
+            digest = self.index.digest(file_path) if self.cache else None
+            result = self.cache.lookup(file_path, digest) if self.cache else None
+            if result is None:
+                result = self.check_file(file_path)
+                if self.cache:
+                    self.cache.store(file_path, digest, result)
+            self._results[file_path] = result
+        return self._results[file_path]
+    
+    def check_files(self, file_paths: List[Path], jobs: int):
+        """Check files not yet known this run or in the cache across a process pool.
+        
+        Results land in the per-run table, so the checks that follow emit
+        their messages in the same order as a serial run. With a sink, each
+        file's issues are streamed as soon as its result is in instead.
+        """
+        pending = []
+        for file_path in map(Path, file_paths):
+            if file_path in self._results:
+                continue
+            digest = self.index.digest(file_path) if self.cache else None
+            result = self.cache.lookup(file_path, digest) if self.cache else None
+            if result is None:
+                pending.append(file_path)
+            else:
+                self._results[file_path] = result
+                if self.sink is not None:
+                    self.report_file(file_path)
+        
+        if jobs <= 1 or len(pending) <= 1:
+            for file_path in pending:
+                self.file_result(file_path)
+                if self.sink is not None:
+                    self.report_file(file_path)
+            return
+        
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(_check_file, str(self.content_dir), str(file_path)): file_path
+                       for file_path in pending}
+            # A sink takes each file's issues as soon as its worker finishes
+            for future in (futures if self.sink is None else as_completed(futures)):
+                file_path = futures[future]
+                digest, result = future.result()
+                if self.cache:
+                    self.cache.store(file_path, digest, result)
+                self._results[file_path] = result
+                if self.sink is not None:
+                    self.report_file(file_path)
+    
+    def add_issue(self, severity: str, rule: str, message: str,
+                  file_path: Optional[Path] = None, pointer: str = ''):
+        """Record an issue, or stream it to the sink when one is attached."""
+        self.counts[severity] += 1
+        if self.sink is None:
+            {'error': self.errors, 'warning': self.warnings, 'info': self.info}[severity].append(message)
+        elif severity != 'info':
+            self.sink.emit({
+                'severity': severity,
+                'rule': rule,
+                'file': str(file_path) if file_path else None,
+                'pointer': pointer,
+                'message': message
+            })
+    
+    def add_file_issues(self, file_path: Path, result: Dict):
+        for severity in ('error', 'warning'):
+            for item in result[severity + 's']:
+                self.add_issue(severity, item['rule'], item['message'], file_path, item['pointer'])
+    
+    def report_file(self, file_path: Path) -> bool:
+        """Add a file's issues once, returning whether it has no errors.
+        
+        With a sink the findings are dropped once streamed, keeping only
+        what the cross-file checks read.
+        """
+        result = self.file_result(file_path)
+        if 'valid' in result:  # Already streamed
+            return result['valid']
+        self.add_file_issues(file_path, result)
+        if self.sink is not None:
+            self._results[file_path] = {'valid': not result['errors'], 'urls': result['urls'],
+                                        'summary': result['summary']}
+        return not result['errors']
+    
+    def reset_issues(self):
+        self.errors, self.warnings, self.info = [], [], []
+        self.counts = {'error': 0, 'warning': 0, 'info': 0}
     
     def validate_json_structure(self, file_path: Path) -> bool:
-        """Validate JSON file structure against schema."""
+        """Validate JSON file structure against schema, plus its links and code examples."""
+        return self.report_file(file_path)
+    
+    def _structure_errors(self, file_path: Path) -> List[Dict]:
+        data = self.index.load(file_path)
+        if data is None:
+            return [finding('json-parse', self.index.load_errors[Path(file_path)])]
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            validate(instance=data, schema=self.module_schema)
-            return True
-            
-        except json.JSONDecodeError as e:
-            self.errors.append(f"JSON decode error in {file_path}: {e}")
-            return False
-        except ValidationError as e:
-            self.errors.append(f"Schema validation error in {file_path}: {e.message}")
-            return False
+            violations = sorted(self.schema_validator.iter_errors(data),
+                                key=lambda e: [str(part) for part in e.absolute_path])
         except Exception as e:
-            self.errors.append(f"Error reading {file_path}: {e}")
-            return False
+            return [finding('json-parse', f"Error reading {file_path}: {e}")]
+        
+        return [
+            finding('schema', f"Schema validation error in {file_path} at "
+                              f"{location(tuple(error.absolute_path))}: {error.message}",
+                    json_pointer(tuple(error.absolute_path)))
+            for error in violations
+        ]
+    
+    def week_summary(self, week: int) -> Optional[Dict]:
+        """Summary of content/weekN/modules.json, or None if missing or unreadable."""
+        file_path = self.index.week_file(week)
+        if not file_path.exists():
+            return None
+        return self.file_result(file_path)['summary']
+    
+    def curriculum_files(self) -> List[Path]:
+        """Project curricula under each curriculum directory."""
+        files = []
+        for directory in self.curriculum_dirs:
+            files.extend(sorted(directory.glob('curriculum*.json')))
+            files.extend(sorted(directory.glob('*/curriculum*.json')))
+        return files
+    
+    def validate_curriculum(self, file_path: Path) -> bool:
+        """Validate one project curriculum file."""
+        valid = self.report_file(file_path)
+        if valid:
+            self.add_issue('info', 'valid-file', f"✓ {file_path} is valid", file_path)
+        return valid
+    
+    def week_files(self, week: int) -> List[Path]:
+        """Module files present in a week directory, required file first."""
+        week_dir = self.content_dir / f"week{week}"
+        return [week_dir / file_name for file_name in WEEK_FILES if (week_dir / file_name).exists()]
     
     def validate_week_content(self, week: int) -> Dict[str, Any]:
         """Validate content for a specific week."""
@@ -98,94 +731,57 @@ class ContentValidator:
         }
         
         if not week_dir.exists():
-            self.errors.append(f"Week {week} directory not found")
+            self.add_issue('error', 'missing-week', f"Week {week} directory not found", week_dir)
             results['valid'] = False
             return results
         
         # Check for required files
-        required_files = ['modules.json']
-        optional_files = ['modules_dashboard.json', 'modules_blog.json', 'modules_automation.json']
-        
-        for file_name in required_files + optional_files:
-            file_path = week_dir / file_name
-            if file_path.exists():
-                results['files'].append(file_name)
-                if self.validate_json_structure(file_path):
-                    self.info.append(f"✓ {file_path} is valid")
-                else:
-                    results['valid'] = False
-                    results['issues'].append(f"Invalid structure in {file_name}")
+        required_files, optional_files = WEEK_FILES[:1], WEEK_FILES[1:]
+        
+        for file_path in self.week_files(week):
+            results['files'].append(file_path.name)
+            if self.validate_json_structure(file_path):
+                self.add_issue('info', 'valid-file', f"✓ {file_path} is valid", file_path)
+            else:
+                results['valid'] = False
+                results['issues'].append(f"Invalid structure in {file_path.name}")
         
         # Check if at least one required file exists
         if not any(f in results['files'] for f in required_files):
             if not any(f in results['files'] for f in optional_files):
-                self.errors.append(f"No module files found in week {week}")
+                self.add_issue('error', 'missing-week', f"No module files found in week {week}", week_dir)
                 results['valid'] = False
         
         return results
     
     def validate_links(self, content: Dict) -> List[str]:
-        """Check for broken links in content."""
-        broken_links = []
-        
-        # Extract all URLs from content
-        def extract_urls(obj):
-            urls = []
-            if isinstance(obj, dict):
-                for value in obj.values():
-                    urls.extend(extract_urls(value))
-            elif isinstance(obj, list):
-                for item in obj:
-                    urls.extend(extract_urls(item))
-            elif isinstance(obj, str):
-                # Find URLs in string
-                url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-                urls.extend(re.findall(url_pattern, obj))
-            return urls
-        
-        urls = extract_urls(content)
-        
-        # For now, just check URL format (in production, you'd check if they're accessible)
-        for url in urls:
-            if not url.startswith(('http://', 'https://')):
-                broken_links.append(url)
-        
-        return broken_links
+        """Check for malformed links in content."""
+        return [url for kind, _, url, _ in scan_content(content) if kind == 'url' and is_malformed_url(url)]
     
     def validate_code_examples(self, content: Dict) -> List[Dict]:
-        """Validate code examples in content."""
-        issues = []
-        
-        def check_code_blocks(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key in ['code', 'solution', 'example']:
-                        # Basic syntax check
-                        if isinstance(value, str) and value.strip():
-                            # Check for common syntax issues
-                            if value.count('(') != value.count(')'):
-                                issues.append({
-                                    'path': f"{path}.{key}",
-                                    'issue': 'Unbalanced parentheses'
-                                })
-                            if value.count('{') != value.count('}'):
-                                issues.append({
-                                    'path': f"{path}.{key}",
-                                    'issue': 'Unbalanced braces'
-                                })
-                            if value.count('[') != value.count(']'):
-                                issues.append({
-                                    'path': f"{path}.{key}",
-                                    'issue': 'Unbalanced brackets'
-                                })
-                    else:
-                        check_code_blocks(value, f"{path}.{key}")
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    check_code_blocks(item, f"{path}[{i}]")
-        
-        check_code_blocks(content)
-        return issues
+        """Syntax-check code examples in content."""
+        blocks = [(path, code, language) for kind, path, code, language in scan_content(content) if kind == 'code']
+        issues = check_snippets((code, language) for _, code, language in blocks)
+        return [
+            {'path': json_pointer(path.parts()), 'issue': issue}
+            for (path, _, _), block_issues in zip(blocks, issues)
+            for issue in block_issues
+        ]
+    
+    def validate_link_health(self, checker) -> Dict[str, Dict]:
+        """Probe every link found in the files validated so far with a LinkChecker."""
+        sources: Dict[str, List[Path]] = {}
+        for file_path, result in self._results.items():
+            for url in result.get('urls', []):
+                sources.setdefault(url, []).append(file_path)
+        
+        results = checker.check(sorted(sources))
+        for url, status in results.items():
+            if not status['ok']:
+                reason = status['status'] or status['error']
+                for file_path in sources[url]:
+                    self.add_issue('error', 'broken-link', f"Broken link in {file_path}: {url} ({reason})", file_path)
+        return results
     
     def validate_progression(self) -> bool:
         """Validate that content progresses logically through weeks."""
@@ -194,24 +790,24 @@ class ContentValidator:
         # Check difficulty progression
         difficulties = []
         for week in range(1, 9):
-            week_file = self.content_dir / f"week{week}" / "modules.json"
-            if week_file.exists():
-                try:
-                    with open(week_file, 'r') as f:
-                        data = json.load(f)
-                    
-                    week_difficulties = [m['difficulty'] for m in data.get('modules', [])]
-                    difficulties.append((week, week_difficulties))
-                    
-                    # Check that difficulty increases over time
-                    if week <= 2 and 'advanced' in week_difficulties:
-                        self.warnings.append(f"Week {week} contains advanced content (might be too early)")
-                    elif week >= 7 and all(d == 'beginner' for d in week_difficulties):
-                        self.warnings.append(f"Week {week} only contains beginner content (should be more advanced)")
-                    
-                except Exception as e:
-                    self.errors.append(f"Error checking progression for week {week}: {e}")
+            summary = self.week_summary(week)
+            if summary is not None:
+                if 'difficulties_error' in summary:
+                    self.add_issue('error', 'check-failed', f"Error checking progression for week {week}: "
+                                                            f"{summary['difficulties_error']}", self.index.week_file(week))
                     valid = False
+                    continue
+                
+                week_difficulties = summary['difficulties']
+                difficulties.append((week, week_difficulties))
+                
+                # Check that difficulty increases over time
+                if week <= 2 and 'advanced' in week_difficulties:
+                    self.add_issue('warning', 'progression', f"Week {week} contains advanced content "
+                                                             f"(might be too early)", self.index.week_file(week))
+                elif week >= 7 and all(d == 'beginner' for d in week_difficulties):
+                    self.add_issue('warning', 'progression', f"Week {week} only contains beginner content "
+                                                             f"(should be more advanced)", self.index.week_file(week))
         
         return valid
     
@@ -221,34 +817,36 @@ class ContentValidator:
         total_xp = 0
         
         for week in range(1, 9):
-            week_file = self.content_dir / f"week{week}" / "modules.json"
-            if week_file.exists():
-                try:
-                    with open(week_file, 'r') as f:
-                        data = json.load(f)
-                    
-                    week_xp = sum(m.get('xp', 0) for m in data.get('modules', []))
-                    xp_data[f"week{week}"] = week_xp
-                    total_xp += week_xp
-                    
-                    # Check if week summary matches calculated XP
-                    summary_xp = data.get('week_summary', {}).get('total_xp', 0)
-                    if summary_xp != week_xp:
-                        self.warnings.append(
-                            f"Week {week} XP mismatch: calculated={week_xp}, summary={summary_xp}"
-                        )
-                    
-                except Exception as e:
-                    self.errors.append(f"Error checking XP for week {week}: {e}")
+            summary = self.week_summary(week)
+            if summary is not None:
+                if 'xp_error' in summary:
+                    self.add_issue('error', 'check-failed', f"Error checking XP for week {week}: {summary['xp_error']}",
+                                   self.index.week_file(week))
+                    continue
+                
+                week_xp = summary['xp']
+                xp_data[f"week{week}"] = week_xp
+                total_xp += week_xp
+                
+                # Check if week summary matches calculated XP
+                summary_xp = summary['summary_xp']
+                if summary_xp != week_xp:
+                    self.add_issue(
+                        'warning', 'xp-mismatch',
+                        f"Week {week} XP mismatch: calculated={week_xp}, summary={summary_xp}",
+                        self.index.week_file(week), '/week_summary/total_xp'
+                    )
         
         # Check for reasonable XP progression
         if xp_data:
             avg_xp = total_xp / len(xp_data)
             for week, xp in xp_data.items():
                 if xp < avg_xp * 0.5:
-                    self.warnings.append(f"{week} has unusually low XP ({xp})")
+                    self.add_issue('warning', 'xp-balance', f"{week} has unusually low XP ({xp})",
+                                   self.content_dir / week / "modules.json")
                 elif xp > avg_xp * 2:
-                    self.warnings.append(f"{week} has unusually high XP ({xp})")
+                    self.add_issue('warning', 'xp-balance', f"{week} has unusually high XP ({xp})",
+                                   self.content_dir / week / "modules.json")
         
         return {
             'total_xp': total_xp,
@@ -258,40 +856,34 @@ class ContentValidator:
     
     def validate_skills_coverage(self) -> Dict:
         """Ensure all necessary skills are covered."""
-        required_skills = [
-            'ai_prompting', 'git', 'html', 'css', 'javascript',
-            'debugging', 'deployment', 'databases'
-        ]
+        required_skills = REQUIRED_SKILLS
         
         skill_coverage = {skill: [] for skill in required_skills}
         uncovered_skills = set(required_skills)
         
         for week in range(1, 9):
-            week_file = self.content_dir / f"week{week}" / "modules.json"
-            if week_file.exists():
-                try:
-                    with open(week_file, 'r') as f:
-                        data = json.load(f)
-                    
-                    for module in data.get('modules', []):
-                        for skill in module.get('skills', []):
-                            if skill in skill_coverage:
-                                skill_coverage[skill].append(f"w{week}m{module['number']}")
-                                uncovered_skills.discard(skill)
-                    
-                except Exception as e:
-                    self.errors.append(f"Error checking skills for week {week}: {e}")
+            summary = self.week_summary(week)
+            if summary is not None:
+                for skill, number in summary['skills']:
+                    if skill in skill_coverage:
+                        skill_coverage[skill].append(f"w{week}m{number}")
+                        uncovered_skills.discard(skill)
+                if 'skills_error' in summary:
+                    self.add_issue('error', 'check-failed', f"Error checking skills for week {week}: "
+                                                            f"{summary['skills_error']}", self.index.week_file(week))
         
         # Report uncovered skills
         if uncovered_skills:
-            self.warnings.append(f"Skills not covered: {', '.join(uncovered_skills)}")
+            self.add_issue(
+                'warning', 'skills-coverage',
+                f"Skills not covered: {', '.join(s for s in required_skills if s in uncovered_skills)}")
         
         # Check for balanced skill distribution
         for skill, modules in skill_coverage.items():
             if len(modules) == 0:
-                self.errors.append(f"Skill '{skill}' is not taught in any module")
+                self.add_issue('error', 'skills-coverage', f"Skill '{skill}' is not taught in any module")
             elif len(modules) == 1:
-                self.warnings.append(f"Skill '{skill}' is only taught once ({modules[0]})")
+                self.add_issue('warning', 'skills-coverage', f"Skill '{skill}' is only taught once ({modules[0]})")
         
         return skill_coverage
     
@@ -346,37 +938,159 @@ class ContentValidator:
         
         return "\n".join(report)
     
-    def validate_all(self) -> bool:
-        """Run all validation checks."""
-        click.echo("Starting content validation...")
+    def validate_all(self, jobs: int = 1, link_checker=None, quiet: bool = False) -> bool:
+        """Run all validation checks, checking files on up to `jobs` processes.
+        
+        With a link_checker, every link found is also probed over HTTP.
+        quiet suppresses progress output.
+        """
+        say = (lambda *args, **kwargs: None) if quiet else click.echo
+        say("Starting content validation...")
+        
+        if jobs > 1:
+            self.check_files([path for week in range(1, 9) for path in self.week_files(week)]
+                             + self.curriculum_files(), jobs)
         
         # Check each week
-        click.echo("\n📁 Validating week directories...")
+        say("\n📁 Validating week directories...")
         for week in range(1, 9):
             results = self.validate_week_content(week)
             if results['valid']:
-                click.echo(f"  ✓ Week {week}")
+                say(f"  ✓ Week {week}")
             else:
-                click.echo(f"  ✗ Week {week} - {len(results['issues'])} issues")
+                say(f"  ✗ Week {week} - {len(results['issues'])} issues")
         
         # Check progression
-        click.echo("\n📈 Validating difficulty progression...")
+        say("\n📈 Validating difficulty progression...")
         if self.validate_progression():
-            click.echo("  ✓ Progression is logical")
+            say("  ✓ Progression is logical")
         
         # Check XP balance
-        click.echo("\n💰 Validating XP distribution...")
+        say("\n💰 Validating XP distribution...")
         xp_data = self.validate_xp_balance()
-        click.echo(f"  Total XP: {xp_data['total_xp']}")
-        click.echo(f"  Average per week: {xp_data['average_per_week']:.0f}")
+        say(f"  Total XP: {xp_data['total_xp']}")
+        say(f"  Average per week: {xp_data['average_per_week']:.0f}")
         
         # Check skills coverage
-        click.echo("\n🎯 Validating skills coverage...")
+        say("\n🎯 Validating skills coverage...")
         skills = self.validate_skills_coverage()
         covered = sum(1 for modules in skills.values() if modules)
-        click.echo(f"  Skills covered: {covered}/{len(skills)}")
+        say(f"  Skills covered: {covered}/{len(skills)}")
+        
+        # Check project curricula
+        say("\n📚 Validating project curricula...")
+        for file_path in self.curriculum_files():
+            errors_before, warnings_before = self.counts['error'], self.counts['warning']
+            if self.validate_curriculum(file_path):
+                say(f"  ✓ {file_path} ({self.counts['warning'] - warnings_before} warnings)")
+            else:
+                say(f"  ✗ {file_path} - {self.counts['error'] - errors_before} errors")
         
-        return len(self.errors) == 0
+        if link_checker:
+            say("\n🔗 Checking links...")
+            links = self.validate_link_health(link_checker)
+            broken = sum(1 for status in links.values() if not status['ok'])
+            say(f"  {len(links)} links, {broken} broken "
+                       f"({link_checker.cached} from cache, {link_checker.probed} probed)")
+        
+        if self.cache:
+            self.cache.save()
+            say(f"\n♻️  Cache: {self.cache.hits} results reused, {self.cache.misses} recomputed")
+        
+        return self.counts['error'] == 0
+
+    def issue_set(self) -> set:
+        return {('error', error) for error in self.errors} | {('warning', warning) for warning in self.warnings}
+    
+    def invalidate(self, changed_paths) -> List[Path]:
+        """Forget this run's results and parsed documents for changed files."""
+        known = {file_path.resolve(): file_path for file_path in self._results}
+        dropped = []
+        for changed_path in changed_paths:
+            file_path = known.get(Path(changed_path).resolve())
+            if file_path is not None:
+                del self._results[file_path]
+                self.index.forget(file_path)
+                dropped.append(file_path)
+        return dropped
+    
+    def watch(self, jobs: int = 1, debounce: float = 0.2):
+        """Revalidate whenever content files change, printing new and resolved issues.
+        
+        Parsed files and their per-file results stay in memory, so a change
+        reparses only the touched file; the cross-file checks then rerun from
+        the per-file summaries.
+        """
+        import threading
+        import time
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+        
+        pending = set()
+        lock = threading.Lock()
+        changed = threading.Event()
+        
+        class ChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Opened/closed-without-write events come from our own reads
+                if event.is_directory or event.event_type not in WRITE_EVENTS:
+                    return
+                paths = [event.src_path, getattr(event, 'dest_path', '')]
+                with lock:
+                    pending.update(Path(p) for p in paths if p and str(p).endswith('.json'))
+                changed.set()
+        
+        self.validate_all(jobs, quiet=True)
+        issues = self.issue_set()
+        click.echo(f"👀 Watching for changes: {len(self.errors)} errors, {len(self.warnings)} warnings "
+                   f"(Ctrl+C to stop)")
+        
+        observer = Observer()
+        handler = ChangeHandler()
+        for directory in dict.fromkeys([self.content_dir] + self.curriculum_dirs):
+            if directory.exists():
+                observer.schedule(handler, str(directory), recursive=True)
+        observer.start()
+        
+        try:
+            while True:
+                changed.wait()
+                # Debounce: editors write several events per save
+                while changed.is_set():
+                    changed.clear()
+                    time.sleep(debounce)
+                with lock:
+                    paths = set(pending)
+                    pending.clear()
+                if not paths:
+                    continue
+                
+                start = time.perf_counter()
+                self.invalidate(paths)
+                self.reset_issues()
+                self.validate_all(quiet=True)
+                current = self.issue_set()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                
+                added, resolved = sorted(current - issues), sorted(issues - current)
+                click.echo(f"\n🔄 {', '.join(sorted(str(p) for p in paths))} "
+                           f"({elapsed_ms:.0f} ms): {len(added)} new, {len(resolved)} resolved")
+                for severity, message in added:
+                    click.echo(f"  + {'✗' if severity == 'error' else '⚠'} {message}")
+                for severity, message in resolved:
+                    click.echo(f"  - ✓ {message}")
+                issues = current
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
+
+def _link_checker(check_links: bool, no_cache: bool, link_cache: str, link_ttl: float, link_concurrency: int):
+    if not check_links:
+        return None
+    from link_checker import LinkChecker
+    return LinkChecker(None if no_cache else link_cache, ttl=link_ttl * 3600, concurrency=link_concurrency)
 
 @click.command()
 @click.option('--week', '-w', type=int, help='Validate specific week (1-8)')
@@ -384,18 +1098,55 @@ class ContentValidator:
 @click.option('--fix', is_flag=True, help='Attempt to fix common issues')
 @click.option('--output', '-o', help='Save report to file')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed output')
-def main(week, all, fix, output, verbose):
+@click.option('--cache-file', default='data/validation_cache.json', show_default=True,
+              help='Per-file result cache; unchanged files are not revalidated')
+@click.option('--no-cache', is_flag=True, help='Revalidate every file and leave the cache untouched')
+@click.option('--jobs', '-j', type=int, default=1, show_default=True,
+              help='Worker processes for parsing and checking files')
+@click.option('--curriculum-dir', multiple=True, default=['content', 'HTML/content'], show_default=True,
+              help='Directory searched for curriculum*.json files (repeatable)')
+@click.option('--check-links', is_flag=True, help='Probe every link over HTTP (with --all)')
+@click.option('--link-cache', default='data/link_cache.json', show_default=True, help='Link check result cache')
+@click.option('--link-ttl', type=float, default=24, show_default=True, help='Hours a cached link result is trusted')
+@click.option('--link-concurrency', type=int, default=20, show_default=True, help='Concurrent link probes')
+@click.option('--watch', is_flag=True, help='Keep running and revalidate content as it changes')
+@click.option('--format', 'report_format', type=click.Choice(['text', 'jsonl', 'sarif']), default='text',
+              show_default=True, help='Report format; jsonl and sarif stream one record per issue to --output or stdout')
+def main(week, all, fix, output, verbose, cache_file, no_cache, jobs, curriculum_dir,
+         check_links, link_cache, link_ttl, link_concurrency, watch, report_format):
     """Validate Project Hampton course content."""
     
-    validator = ContentValidator()
+    validator = ContentValidator(cache_path=None if no_cache else cache_file,
+                                 curriculum_dirs=list(curriculum_dir))
+    
+    if report_format != 'text' and (week or all) and not watch:
+        # Structured output goes straight to the stream, without progress text
+        stream = open(output, 'w', encoding='utf-8') if output else sys.stdout
+        validator.sink = (JsonlSink if report_format == 'jsonl' else SarifSink)(stream)
+        if week:
+            validator.validate_week_content(week)
+            if validator.cache:
+                validator.cache.save()
+        else:
+            validator.validate_all(jobs, _link_checker(check_links, no_cache, link_cache, link_ttl,
+                                                       link_concurrency), quiet=True)
+        validator.sink.close()
+        if output:
+            stream.close()
+        sys.exit(0 if validator.counts['error'] == 0 else 1)
     
     click.echo("🔍 Project Hampton Content Validator")
     click.echo("=" * 40)
     
-    if week:
+    if watch:
+        validator.watch(jobs)
+    
+    elif week:
         # Validate specific week
         click.echo(f"\nValidating Week {week}...")
         results = validator.validate_week_content(week)
+        if validator.cache:
+            validator.cache.save()
         
         if results['valid']:
             click.echo(f"✅ Week {week} is valid!")
@@ -406,7 +1157,8 @@ def main(week, all, fix, output, verbose):
     
     elif all:
         # Validate everything
-        valid = validator.validate_all()
+        link_checker = _link_checker(check_links, no_cache, link_cache, link_ttl, link_concurrency)
+        valid = validator.validate_all(jobs, link_checker)
         
         # Generate report
         report = validator.generate_report()
@@ -428,6 +1180,7 @@ def main(week, all, fix, output, verbose):
         click.echo("  Validate all content: python content_validator.py --all")
         click.echo("  Validate specific week: python content_validator.py --week 1")
         click.echo("  Save report: python content_validator.py --all --output report.txt")
+        click.echo("  Revalidate on save: python content_validator.py --watch")
         click.echo("\nUse --help for more options")
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Link Checker
+Concurrent link probing with an on-disk result cache for Project Hampton content
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+USER_AGENT = 'ProjectHampton-LinkChecker/1.0'
+
+# Statuses servers often return for HEAD even though GET works
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 429, 501}
+
+class LinkCache:
+    """Link check results on disk, each trusted for `ttl` seconds."""
+
+    def __init__(self, cache_path: Path, ttl: float):
+        self.cache_path = Path(cache_path)
+        self.ttl = ttl
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r') as f:
+                    self.entries = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass  # A corrupt cache is just rebuilt
+
+    def get(self, url: str, now: float) -> Optional[Dict]:
+        entry = self.entries.get(url)
+        if entry and now - entry['checked_at'] < self.ttl:
+            return entry
+        return None
+
+    def put(self, url: str, result: Dict):
+        self.entries[url] = result
+        self.dirty = True
+
+    def save(self):
+        """Write the cache back, dropping expired entries."""
+        if not self.dirty:
+            return
+        now = time.time()
+        self.entries = {url: entry for url, entry in self.entries.items() if now - entry['checked_at'] < self.ttl}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        self.dirty = False
+
+class LinkChecker:
+    """Probe URLs concurrently: HEAD first, GET when HEAD is refused or fails.
+
+    At most `concurrency` probes run at once and each host gets at most
+    `per_host`, so checking every curriculum link at once does not hammer
+    any one site. A probe's timeout starts once it has its slot, so links
+    queued behind a slow host are not reported as timed out.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, ttl: float = 24 * 3600,
+                 concurrency: int = 20, per_host: int = 4, timeout: float = 10.0):
+        self.cache = LinkCache(cache_path, ttl) if cache_path else None
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cached = 0
+        self.probed = 0
+
+    def check(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """Check each distinct URL, returning url -> {'ok', 'status', 'error', 'checked_at'}."""
+        now = time.time()
+        results = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            entry = self.cache.get(url, now) if self.cache else None
+            if entry is None:
+                pending.append(url)
+            else:
+                results[url] = entry
+        self.cached += len(results)
+        self.probed += len(pending)
+
+        if pending:
+            probed = asyncio.run(self._check_all(pending))
+            for url in pending:
+                results[url] = probed[url]
+                # Timeouts and connection errors may be transient, so they
+                # are probed again next run rather than trusted for the TTL
+                if self.cache and probed[url]['status'] is not None:
+                    self.cache.put(url, probed[url])
+        if self.cache:
+            self.cache.save()
+        return results
+
+    async def _check_all(self, urls: List[str]) -> Dict[str, Dict]:
+        # aiohttp is only needed when links are actually checked
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+        slots = asyncio.Semaphore(self.concurrency)
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+
+        async def probe(url: str) -> Dict:
+            host_slot = host_slots.setdefault(urlsplit(url).netloc.lower(), asyncio.Semaphore(self.per_host))
+            async with host_slot, slots:
+                return await self._probe(session, url)
+
+        async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT}) as session:
+            results = await asyncio.gather(*(probe(url) for url in urls))
+        return dict(zip(urls, results))
+
+    async def _probe(self, session, url: str) -> Dict:
+        import aiohttp
+
+        # The clock starts here, once the probe holds a connection slot
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        status, error = None, None
+        for method in ('HEAD', 'GET'):
+            try:
+                async with session.request(method, url, allow_redirects=True, timeout=timeout) as response:
+                    status, error = response.status, None
+            except asyncio.TimeoutError:
+                status, error = None, 'timed out'
+            except aiohttp.ClientError as e:
+                status, error = None, str(e) or type(e).__name__
+            if status is not None and status not in HEAD_FALLBACK_STATUSES:
+                break
+
+        return {
+            'ok': status is not None and status < 400,
+            'status': status,
+            'error': error,
+            'checked_at': time.time()
+        }
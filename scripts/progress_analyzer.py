@@ -4,23 +4,716 @@ Progress Analyzer Script
 Analyzes user progress data and generates insights for Project Hampton
 """
 
+from __future__ import annotations
+
 import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple, TYPE_CHECKING
 import click
-import pandas as pd
-import numpy as np
 from collections import defaultdict
+from functools import lru_cache
 import base64
-import matplotlib.pyplot as plt
-import seaborn as sns
+import hashlib
+import html
+import io
+import math
+import re
+import struct
+
+# pandas and numpy are imported where they're used so that single-code
+# lookups start fast
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Project segment of a progress code -> project id, for v1 and v2 codes alike:
+# projectMap in js/modules/progressTracker.js plus the generator's project types
+PROJECT_CODE_MAP = {
+    'NONE': 'none',
+    'TICT': 'tictactoe',
+    'SNOW': 'servicenow',
+    'AUTO': 'automation',
+    'MSFT': 'msgraph',
+    'DASH': 'dashboard',
+    'BLOG': 'blog'
+}
+
+# Whole-code shape: HAMPTON-PROJ-W#M#-XXXX-YYYY (five dash-separated parts),
+# or HAMPTON-PROJ-D#L#-XXXX-YYYY from the 30-day curricula, whose lesson is
+# 0-based. The position groups only match the canonical forms handled by
+# the vectorized fast path.
+CODE_PATTERN = (r'^HAMPTON-([^-]*)-((?:W([0-9]{1,3})M([0-9]{1,3}))|(?:D([0-9]{1,3})L([0-9]{1,3}))|[^-]*)'
+                r'-([^-]*)-([^-]*)\Z')
+
+# Version 2 codes: HAMPTON2-XXXXX-XXXXX-XXXXX-XXXXX-CCCC, where the four
+# groups are the base32 encoding of one V2_STRUCT record and CCCC is the
+# checksum of those 20 characters
+V2_PREFIX = 'HAMPTON2'
+V2_VERSION = 2
+# Project code stored in a v2 record, by index
+V2_PROJECT_CODES = tuple(PROJECT_CODE_MAP)
+V2_FIELDS = ('version', 'project', 'week', 'module', 'xp', 'achievements', 'completed_modules')
+V2_STRUCT = struct.Struct('>BBBBIHH')
+V2_PATTERN = r'^HAMPTON2-([A-Z2-7]{5})-([A-Z2-7]{5})-([A-Z2-7]{5})-([A-Z2-7]{5})-([0-9A-Z]{1,4})\Z'
+BASE32_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567'
+
+# Digit alphabet for Number.prototype.toString(36), upper-cased like the front end
+BASE36_DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Record layout of the persistent progress store (records.bin). Missing
+# payload fields (v1 codes) are stored as -1.
+STORE_FIELDS = [
+    ('code_hash', '<u8'),
+    ('ingested_at', '<i8'),
+    ('project', 'u1'),
+    ('week', '<u2'),
+    ('module', '<u2'),
+    ('day', '<u2'),
+    ('lesson', '<u2'),
+    ('checksum_valid', '?'),
+    ('xp', '<i8'),
+    ('achievements', '<i4'),
+    ('completed_modules', '<i4'),
+    ('code', 'S48')
+]
+# Layout version kept in the store's meta.json; version 1 had no day/lesson
+STORE_VERSION = 2
+
+# Default dashboard grids: 8 weeks x 5 modules, and 30 days x 4 lessons
+WEEK_GRID = (8, 5)
+DAY_GRID = (30, 4)
+
+# Largest week/module position the heatmap grows to; codes beyond it still
+# count towards every other statistic
+HEATMAP_LIMIT = 255
+
+# Default number of codes decoded per chunk when streaming a codes file
+DEFAULT_CHUNK_SIZE = 100_000
+
+@lru_cache(maxsize=None)
+def v2_layout() -> np.dtype:
+    """NumPy record dtype matching V2_STRUCT."""
+    import numpy as np
+    formats = ['u1', 'u1', 'u1', 'u1', '>u4', '>u2', '>u2']
+    return np.dtype(list(zip(V2_FIELDS, formats)))
+
+@lru_cache(maxsize=None)
+def store_layout() -> np.dtype:
+    """NumPy record dtype of the progress store."""
+    import numpy as np
+    return np.dtype(STORE_FIELDS)
+
+def add_positions(grid: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Count 1-based (row, col) positions into a grid, growing it to fit.
+    
+    Positions outside 1..HEATMAP_LIMIT are left out.
+    """
+    import numpy as np
+    in_range = (rows >= 1) & (rows <= HEATMAP_LIMIT) & (cols >= 1) & (cols <= HEATMAP_LIMIT)
+    rows, cols = rows[in_range], cols[in_range]
+    if not len(rows):
+        return grid
+    grid = pad_grid(grid, int(rows.max()), int(cols.max()))
+    height, width = grid.shape
+    flat = np.bincount((rows - 1) * width + (cols - 1), minlength=height * width)
+    return grid + flat.reshape(height, width)
+
+def pad_grid(grid: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Pad a grid with zeros to at least rows x cols."""
+    import numpy as np
+    height, width = grid.shape
+    if rows <= height and cols <= width:
+        return grid
+    return np.pad(grid, ((0, max(0, rows - height)), (0, max(0, cols - width))))
+
+def _to_base36(value: int) -> str:
+    """Format a non-negative integer in upper-case base 36."""
+    digits = ''
+    while True:
+        value, remainder = divmod(value, 36)
+        digits = BASE36_DIGITS[remainder] + digits
+        if not value:
+            return digits
+
+def generate_checksum(value: str) -> str:
+    """Python port of generateChecksum in js/modules/progressTracker.js."""
+    hash_value = 0
+    for char in value:
+        # ((hash << 5) - hash) + char, truncated to a signed 32-bit int
+        hash_value = (hash_value * 31 + ord(char)) & 0xFFFFFFFF
+    if hash_value >= 0x80000000:
+        hash_value -= 0x100000000
+    return _to_base36(abs(hash_value))
+
+def generate_checksums_bulk(values: Iterable[str]) -> np.ndarray:
+    """Vectorized generate_checksum over many ASCII strings."""
+    import numpy as np
+    data = np.asarray(list(values), dtype=np.bytes_)
+    if not len(data):
+        return np.array([], dtype=str)
+    
+    width = data.dtype.itemsize
+    chars = data.view(np.uint8).reshape(len(data), width).astype(np.uint32)
+    lengths = np.char.str_len(data)
+    
+    # uint32 arithmetic wraps exactly like the JS 32-bit truncation
+    hashes = np.zeros(len(data), dtype=np.uint32)
+    for i in range(width):
+        hashes = np.where(i < lengths, hashes * np.uint32(31) + chars[:, i], hashes)
+    remaining = np.abs(hashes.view(np.int32).astype(np.int64))
+    
+    # abs(int32) < 36**7, so seven digits always suffice
+    alphabet = np.frombuffer(BASE36_DIGITS.encode('ascii'), dtype=np.uint8)
+    digits = np.empty((len(data), 7), dtype=np.uint8)
+    for i in range(6, -1, -1):
+        digits[:, i] = alphabet[remaining % 36]
+        remaining //= 36
+    text = np.char.lstrip(digits.view('S7').ravel(), b'0')
+    return np.where(text == b'', b'0', text).astype(str)
+
+def progress_payload(project_code: str) -> str:
+    """Rebuild the encoded payload that generateProgressCode checksums.
+    
+    The front end base64-encodes JSON that starts with {"p":"<project>"
+    and keeps the first 12 alphanumeric characters, i.e. the first 9 bytes.
+    Those never reach the week or module, so the checksum is a constant
+    per project code: it rejects garbage and mistyped project segments, but
+    a v1 code with a forged position still verifies. v2 codes checksum
+    their whole payload.
+    """
+    # Whatever the project code, the JSON continues with the week key
+    prefix = (json.dumps({'p': project_code}, separators=(',', ':'), ensure_ascii=False)[:-1]
+              + ',"w":').encode('utf-8')
+    # Only whole 3-byte groups encode independently of the bytes that follow
+    known = prefix[:len(prefix) // 3 * 3]
+    encoded = re.sub(r'[^A-Za-z0-9]', '', base64.b64encode(known).decode('ascii'))
+    return encoded[:12].upper()
+
+def verify_progress_checksum(project_code: str, checksum: str) -> bool:
+    """Check the checksum segment of a v1 progress code (see progress_payload)."""
+    return generate_checksum(progress_payload(project_code))[:4] == checksum
+
+def encode_progress_code_v2(project_code: str, week: int, module: int, xp: int,
+                            achievements: int, completed_modules: int) -> str:
+    """Build a version 2 progress code that carries the full progress payload."""
+    if project_code not in V2_PROJECT_CODES:
+        raise ValueError(f"Unknown project code: {project_code}")
+    
+    values = (V2_VERSION, V2_PROJECT_CODES.index(project_code), week, module,
+              xp, achievements, completed_modules)
+    for name, code, value in zip(V2_FIELDS, V2_STRUCT.format[1:], values):
+        limit = (1 << (8 * struct.calcsize(code))) - 1
+        if not 0 <= value <= limit:
+            raise ValueError(f"{name} must be between 0 and {limit}, got {value}")
+    
+    body = base64.b32encode(V2_STRUCT.pack(*values)).decode('ascii').rstrip('=')
+    groups = [body[i:i + 5] for i in range(0, len(body), 5)]
+    return '-'.join([V2_PREFIX, *groups, generate_checksum(body)[:4]])
+
+def decode_progress_codes_v2_bulk(normalized: pd.Series) -> pd.DataFrame:
+    """Decode the version 2 codes in a series of upper-cased, stripped codes.
+    
+    Returns one row per well-formed v2 code, indexed like the input.
+    """
+    import numpy as np
+    import pandas as pd
+    parts = normalized.str.extract(V2_PATTERN).dropna()
+    body = parts[0] + parts[1] + parts[2] + parts[3]
+    
+    # Base32 -> 5-bit values -> bit matrix -> packed 12-byte records
+    lookup = np.zeros(256, dtype=np.uint8)
+    lookup[np.frombuffer(BASE32_ALPHABET.encode('ascii'), dtype=np.uint8)] = np.arange(32, dtype=np.uint8)
+    chars = np.asarray(body.tolist(), dtype='S20').view(np.uint8).reshape(len(body), 20)
+    bits = np.unpackbits(lookup[chars][:, :, None], axis=2)[:, :, 3:].reshape(len(body), 100)
+    record_bits = v2_layout().itemsize * 8
+    records = np.packbits(bits[:, :record_bits], axis=1).view(v2_layout()).ravel()
+    
+    known = (records['version'] == V2_VERSION) & (records['project'] < len(V2_PROJECT_CODES))
+    project_codes = np.array(V2_PROJECT_CODES + ('',), dtype=object)[
+        np.minimum(records['project'], len(V2_PROJECT_CODES))]
+    checksums = pd.Series(generate_checksums_bulk(body.tolist()), dtype=object).str[:4].to_numpy()
+    
+    decoded = pd.DataFrame({
+        'project': [PROJECT_CODE_MAP.get(code, 'unknown') for code in project_codes],
+        'week': records['week'].astype(np.int64),
+        'module': records['module'].astype(np.int64),
+        'checksum': parts[4].to_numpy(),
+        'data': body.to_numpy(),
+        'checksum_valid': checksums == parts[4].to_numpy(),
+        'xp': records['xp'].astype(np.int64),
+        'achievements': records['achievements'].astype(np.int64),
+        'completed_modules': records['completed_modules'].astype(np.int64)
+    }, index=parts.index)
+    return decoded[known]
+
+class ProgressAggregate:
+    """Running totals over decoded progress codes.
+    
+    Holds only counts and sums, so analytics can be folded chunk by chunk
+    without keeping decoded rows in memory. Week/module and day/lesson
+    positions are tracked separately; a code has one or the other.
+    """
+    
+    def __init__(self, weeks: int = WEEK_GRID[0], modules_per_week: int = WEEK_GRID[1],
+                 days: int = DAY_GRID[0], lessons_per_day: int = DAY_GRID[1]):
+        import numpy as np
+        self.total_codes = 0
+        self.valid_codes = 0
+        self.invalid_checksums = 0
+        self.project_counts = defaultdict(int)
+        self.week_codes = 0  # Codes with a week/module position
+        self.week_sum = 0
+        self.module_sum = 0
+        self.max_week = 0
+        self.max_module = 0  # Furthest module within max_week
+        self.day_codes = 0  # Codes with a day/lesson position (30-day curricula)
+        self.day_sum = 0
+        self.lesson_sum = 0
+        self.max_day = 0
+        self.max_lesson = 0  # Furthest lesson within max_day
+        self.payload_codes = 0  # Codes carrying XP/achievement fields (v2)
+        self.xp_sum = 0
+        self.achievements_sum = 0
+        self.completed_modules_sum = 0
+        self.project_position_sums = {}  # project -> [week sum, module sum]
+        self.project_week_codes = {}  # project -> codes with a week position
+        self.heatmap = np.zeros((weeks, modules_per_week), dtype=np.int64)
+        self.day_heatmap = np.zeros((days, lessons_per_day), dtype=np.int64)
+    
+    def update(self, decoded: pd.DataFrame) -> None:
+        """Fold a frame from decode_progress_codes_bulk into the totals.
+        
+        Codes whose checksum doesn't verify are counted but left out of
+        the statistics.
+        """
+        import numpy as np
+        import pandas as pd
+        self.total_codes += len(decoded)
+        df = decoded[decoded['valid']]
+        self.invalid_checksums += int((~df['checksum_valid']).sum())
+        df = df[df['checksum_valid']]
+        if df.empty:
+            return
+        
+        self.valid_codes += len(df)
+        for project, count in df['project'].value_counts(sort=False).items():
+            if count:
+                self.project_counts[project] += int(count)
+        
+        payload = df[df['xp'].notna()]
+        if not payload.empty:
+            self.payload_codes += len(payload)
+            self.xp_sum += int(payload['xp'].to_numpy(dtype=np.int64).sum())
+            self.achievements_sum += int(payload['achievements'].to_numpy(dtype=np.int64).sum())
+            self.completed_modules_sum += int(payload['completed_modules'].to_numpy(dtype=np.int64).sum())
+        
+        days = df['day'].to_numpy(dtype=np.int64)
+        lessons = df['lesson'].to_numpy(dtype=np.int64)
+        by_day = days > 0
+        self._update_days(days[by_day], lessons[by_day])
+        
+        df = df[~by_day]
+        if df.empty:
+            return
+        weeks = df['week'].to_numpy(dtype=np.int64)
+        modules = df['module'].to_numpy(dtype=np.int64)
+        
+        self.week_codes += len(df)
+        project_index, projects = pd.factorize(df['project'].to_numpy())
+        counts = np.bincount(project_index, minlength=len(projects))
+        week_sums = np.bincount(project_index, weights=weeks, minlength=len(projects))
+        module_sums = np.bincount(project_index, weights=modules, minlength=len(projects))
+        for i, project in enumerate(projects):
+            self.project_week_codes[project] = self.project_week_codes.get(project, 0) + int(counts[i])
+            sums = self.project_position_sums.setdefault(project, [0, 0])
+            sums[0] += int(week_sums[i])
+            sums[1] += int(module_sums[i])
+        self.week_sum += int(weeks.sum())
+        self.module_sum += int(modules.sum())
+        
+        chunk_max_week = int(weeks.max())
+        chunk_max_module = int(modules[weeks == chunk_max_week].max())
+        self._update_furthest(chunk_max_week, chunk_max_module)
+        
+        # Grow the heatmap to fit instead of dropping positions outside the
+        # default 8x5 grid (e.g. longer curricula)
+        self.heatmap = add_positions(self.heatmap, weeks, modules)
+    
+    def _update_days(self, days: np.ndarray, lessons: np.ndarray) -> None:
+        if not len(days):
+            return
+        self.day_codes += len(days)
+        self.day_sum += int(days.sum())
+        self.lesson_sum += int(lessons.sum())
+        chunk_max_day = int(days.max())
+        self._update_furthest_day(chunk_max_day, int(lessons[days == chunk_max_day].max()))
+        self.day_heatmap = add_positions(self.day_heatmap, days, lessons)
+    
+    def merge(self, other: 'ProgressAggregate') -> None:
+        """Fold another aggregate (e.g. from a worker shard) into this one."""
+        self.total_codes += other.total_codes
+        self.valid_codes += other.valid_codes
+        self.invalid_checksums += other.invalid_checksums
+        for project, count in other.project_counts.items():
+            self.project_counts[project] += count
+        for project, (week_sum, module_sum) in other.project_position_sums.items():
+            sums = self.project_position_sums.setdefault(project, [0, 0])
+            sums[0] += week_sum
+            sums[1] += module_sum
+        for project, count in other.project_week_codes.items():
+            self.project_week_codes[project] = self.project_week_codes.get(project, 0) + count
+        self.week_codes += other.week_codes
+        self.week_sum += other.week_sum
+        self.module_sum += other.module_sum
+        if other.week_codes:
+            self._update_furthest(other.max_week, other.max_module)
+        self.day_codes += other.day_codes
+        self.day_sum += other.day_sum
+        self.lesson_sum += other.lesson_sum
+        if other.day_codes:
+            self._update_furthest_day(other.max_day, other.max_lesson)
+        self.payload_codes += other.payload_codes
+        self.xp_sum += other.xp_sum
+        self.achievements_sum += other.achievements_sum
+        self.completed_modules_sum += other.completed_modules_sum
+        for name in ('heatmap', 'day_heatmap'):
+            grid, other_grid = getattr(self, name), getattr(other, name)
+            grid = pad_grid(grid, *other_grid.shape)
+            rows, cols = other_grid.shape
+            grid[:rows, :cols] += other_grid
+            setattr(self, name, grid)
+    
+    def to_dict(self) -> Dict:
+        """Serialize the running totals to plain JSON types."""
+        state = {key: value for key, value in vars(self).items()
+                 if key not in ('project_counts', 'heatmap', 'day_heatmap')}
+        state['project_counts'] = dict(self.project_counts)
+        state['project_position_sums'] = {key: list(value) for key, value in self.project_position_sums.items()}
+        state['heatmap'] = self.heatmap.tolist()
+        state['day_heatmap'] = self.day_heatmap.tolist()
+        return state
+    
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'ProgressAggregate':
+        """Restore an aggregate saved with to_dict."""
+        import numpy as np
+        aggregate = cls()
+        for key, value in state.items():
+            if key in ('heatmap', 'day_heatmap'):
+                setattr(aggregate, key, np.array(value, dtype=np.int64))
+            elif key != 'project_counts':
+                setattr(aggregate, key, value)
+        aggregate.project_counts.update(state['project_counts'])
+        # Aggregates saved before day positions were tracked count every code as weekly
+        if 'week_codes' not in state:
+            aggregate.week_codes = state['valid_codes']
+            aggregate.project_week_codes = dict(state['project_counts'])
+        return aggregate
+    
+    def _update_furthest(self, week: int, module: int) -> None:
+        if week > self.max_week:
+            self.max_week, self.max_module = week, module
+        elif week == self.max_week:
+            self.max_module = max(self.max_module, module)
+    
+    def _update_furthest_day(self, day: int, lesson: int) -> None:
+        if day > self.max_day:
+            self.max_day, self.max_lesson = day, lesson
+        elif day == self.max_day:
+            self.max_lesson = max(self.max_lesson, lesson)
+    
+    def to_analytics(self) -> Dict:
+        """Build the analytics dict returned by analyze_progress_codes.
+        
+        Week statistics cover codes with a week/module position and the
+        'daily' section codes with a day/lesson position; either is None
+        when no such codes were seen.
+        """
+        if not self.valid_codes:
+            return {'error': 'No valid codes found', 'invalid_checksums': self.invalid_checksums}
+        
+        project_distribution = dict(sorted(self.project_counts.items(), key=lambda item: -item[1]))
+        weekly = self.week_codes or None
+        daily = self.day_codes or None
+        
+        return {
+            'total_codes': self.total_codes,
+            'valid_codes': self.valid_codes,
+            'invalid_codes': self.total_codes - self.valid_codes,
+            'invalid_checksums': self.invalid_checksums,
+            'project_distribution': project_distribution,
+            'week_codes': self.week_codes,
+            'average_week': self.week_sum / weekly if weekly else None,
+            'average_module': self.module_sum / weekly if weekly else None,
+            'furthest_progress': {
+                'week': self.max_week,
+                'module': self.max_module
+            },
+            'completion_rate': (self.week_sum * 5 + self.module_sum) / weekly / 40 * 100 if weekly else None,  # 40 total modules
+            'daily': {
+                'codes': self.day_codes,
+                'average_day': self.day_sum / daily if daily else None,
+                'average_lesson': self.lesson_sum / daily if daily else None,
+                'furthest_progress': {
+                    'day': self.max_day,
+                    'lesson': self.max_lesson
+                },
+                'completion_rate': self.day_sum / daily / DAY_GRID[0] * 100 if daily else None  # 30 days
+            },
+            'payload': {
+                'codes': self.payload_codes,
+                'total_xp': self.xp_sum,
+                'average_xp': self.xp_sum / self.payload_codes if self.payload_codes else None,
+                'average_achievements': self.achievements_sum / self.payload_codes if self.payload_codes else None,
+                'average_completed_modules': (self.completed_modules_sum / self.payload_codes
+                                              if self.payload_codes else None)
+            }
+        }
+
+class ProgressStore:
+    """Append-only columnar store of decoded progress codes.
+    
+    Records live in a flat binary file of STORE_FIELDS records that is read
+    back through a NumPy memory map; project names and the layout version
+    are kept in meta.json. Codes are deduplicated by a hash of the
+    normalized code.
+    """
+    
+    def __init__(self, store_dir: Path):
+        self.store_dir = Path(store_dir)
+        self.records_path = self.store_dir / 'records.bin'
+        self.meta_path = self.store_dir / 'meta.json'
+        self._hashes = None  # Sorted code hashes, loaded on first ingest
+    
+    def __len__(self) -> int:
+        if not self.records_path.exists():
+            return 0
+        return self.records_path.stat().st_size // store_layout().itemsize
+    
+    def load(self) -> np.ndarray:
+        """Memory-map all stored records (read-only)."""
+        import numpy as np
+        self._upgrade()
+        count = len(self)
+        if not count:
+            return np.zeros(0, dtype=store_layout())
+        return np.memmap(self.records_path, dtype=store_layout(), mode='r', shape=(count,))
+    
+    def projects(self) -> List[str]:
+        """Project names indexed by the stored project column."""
+        return self._meta().get('projects', [])
+    
+    def _meta(self) -> Dict:
+        if not self.meta_path.exists():
+            return {}
+        with open(self.meta_path, 'r') as f:
+            return json.load(f)
+    
+    def _write_meta(self, projects: List[str]) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.meta_path, 'w') as f:
+            json.dump({'version': STORE_VERSION, 'projects': projects}, f, indent=2)
+    
+    def _upgrade(self) -> None:
+        """Rewrite a version 1 store (no day/lesson columns) in the current layout.
+        
+        Day positions are recovered from the stored codes.
+        """
+        import numpy as np
+        import pandas as pd
+        if not self.records_path.exists() or self._meta().get('version', 1) >= STORE_VERSION:
+            return
+        
+        old = np.fromfile(self.records_path, dtype=np.dtype([field for field in STORE_FIELDS
+                                                             if field[0] not in ('day', 'lesson')]))
+        records = np.zeros(len(old), dtype=store_layout())
+        for name in old.dtype.names:
+            records[name] = old[name]
+        positions = pd.Series(np.char.decode(old['code'], 'ascii')).str.extract(CODE_PATTERN)
+        by_day = positions[4].notna().to_numpy()
+        records['day'][by_day] = positions[4][by_day].astype(int)
+        records['lesson'][by_day] = positions[5][by_day].astype(int) + 1
+        
+        upgraded_path = self.records_path.with_name(self.records_path.name + '.tmp')
+        records.tofile(upgraded_path)
+        os.replace(upgraded_path, self.records_path)
+        self._write_meta(self.projects())
+    
+    def ingest(self, decoded: pd.DataFrame, timestamp: Optional[datetime] = None) -> int:
+        """Append valid rows of a decode_progress_codes_bulk frame.
+        
+        Codes already in the store (or repeated within the frame) are
+        skipped. Returns the number of records written.
+        """
+        import numpy as np
+        import pandas as pd
+        df = decoded[decoded['valid']]
+        if df.empty:
+            return 0
+        
+        normalized = df['code'].astype(str).str.upper().str.strip()
+        hashes = pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+        if self._hashes is None:
+            self._hashes = np.sort(self.load()['code_hash'])
+        
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+        if len(self._hashes):
+            positions = np.minimum(np.searchsorted(self._hashes, hashes), len(self._hashes) - 1)
+            keep &= self._hashes[positions] != hashes
+        if not keep.any():
+            return 0
+        df = df[keep]
+        
+        projects = self.projects()
+        for project in df['project'].astype(str).unique():
+            if project not in projects:
+                projects.append(project)
+        self._write_meta(projects)
+        
+        records = np.zeros(len(df), dtype=store_layout())
+        records['code_hash'] = hashes[keep]
+        records['ingested_at'] = int((timestamp or datetime.now()).timestamp())
+        records['project'] = pd.Categorical(df['project'].astype(str), categories=projects).codes
+        records['week'] = np.minimum(df['week'].to_numpy(dtype=np.int64), np.iinfo(np.uint16).max)
+        records['module'] = np.minimum(df['module'].to_numpy(dtype=np.int64), np.iinfo(np.uint16).max)
+        records['day'] = np.minimum(df['day'].to_numpy(dtype=np.int64), np.iinfo(np.uint16).max)
+        records['lesson'] = np.minimum(df['lesson'].to_numpy(dtype=np.int64), np.iinfo(np.uint16).max)
+        records['checksum_valid'] = df['checksum_valid'].to_numpy()
+        for column in ('xp', 'achievements', 'completed_modules'):
+            records[column] = df[column].to_numpy(dtype=np.int64, na_value=-1)
+        records['code'] = normalized[keep].str.encode('ascii', errors='replace').to_numpy()
+        
+        with open(self.records_path, 'ab') as f:
+            f.write(records.tobytes())
+        self._hashes = np.sort(np.concatenate([self._hashes, records['code_hash']]))
+        return len(records)
+    
+    def to_frame(self, since: Optional[datetime] = None, with_codes: bool = False) -> pd.DataFrame:
+        """Stored records as a decode_progress_codes_bulk-style frame."""
+        import numpy as np
+        import pandas as pd
+        records = self.load()
+        if since is not None:
+            records = records[records['ingested_at'] >= int(since.timestamp())]
+        
+        frame = pd.DataFrame({
+            'project': pd.Categorical.from_codes(records['project'], categories=self.projects() or ['unknown']),
+            'week': np.asarray(records['week']),
+            'module': np.asarray(records['module']),
+            'day': np.asarray(records['day']),
+            'lesson': np.asarray(records['lesson']),
+            'checksum_valid': np.asarray(records['checksum_valid']),
+            'ingested_at': pd.to_datetime(records['ingested_at'], unit='s'),
+            'valid': np.ones(len(records), dtype=bool)
+        })
+        for column, dtype in (('xp', 'UInt32'), ('achievements', 'UInt16'), ('completed_modules', 'UInt16')):
+            values = pd.Series(records[column])
+            frame[column] = values.where(values >= 0).astype(dtype)
+        if with_codes:
+            frame.insert(0, 'code', np.char.decode(records['code'], 'ascii'))
+        return frame
+
+def curriculum_shapes(path: str) -> Dict[str, Tuple[int, int]]:
+    """Heatmap shapes (positions x items per position) of a curriculum file.
+    
+    Understands content/weekN/modules.json, curriculum.json files with
+    weeks -> modules, and day-based curricula (days -> lessons, optionally
+    nested under projects). Returns a shape under 'weeks' and/or 'days'.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    shapes = defaultdict(list)
+    for curriculum in [data] + list(data.get('projects', {}).values()):
+        if isinstance(curriculum.get('weeks'), dict):
+            kind, sections = 'weeks', [week.get('modules', []) for week in curriculum['weeks'].values()]
+        elif isinstance(curriculum.get('days'), dict):
+            kind, sections = 'days', [day.get('lessons', []) for day in curriculum['days'].values()]
+        elif isinstance(curriculum.get('modules'), list):
+            kind, sections = 'weeks', [[]] * (curriculum.get('week', 1) - 1) + [curriculum['modules']]
+        else:
+            continue
+        shapes[kind].append((len(sections), max((len(items) for items in sections), default=0)))
+    
+    if not shapes:
+        raise ValueError(f"No weeks or days found in {path}")
+    return {kind: (max(rows for rows, _ in found), max(cols for _, cols in found))
+            for kind, found in shapes.items()}
+
+def iter_code_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     start: int = 0, end: Optional[int] = None) -> Iterator[List[str]]:
+    """Yield non-empty, stripped lines of a codes file in fixed-size chunks.
+    
+    With a byte range, only lines that start inside [start, end) are read,
+    so adjacent ranges cover every line exactly once.
+    """
+    chunk = []
+    with open(path, 'rb') as f:
+        if start > 0:
+            # Skip the line straddling the range start; the previous range owns it
+            f.seek(start - 1)
+            f.readline()
+        while end is None or f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            line = line.decode('utf-8', errors='replace').strip()
+            if line:
+                chunk.append(line)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+def split_byte_ranges(path: str, shards: int, start: int = 0, end: Optional[int] = None) -> List[tuple]:
+    """Split a file (or its [start, end) slice) into roughly equal byte ranges."""
+    end = os.path.getsize(path) if end is None else end
+    size = end - start
+    shards = max(1, min(shards, size))
+    bounds = [start + size * i // shards for i in range(shards + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def complete_lines_end(path: str, floor: int = 0) -> int:
+    """Byte offset just past the last newline in a file, scanning back no further than floor.
+    
+    A trailing line without a newline may still be being written, so
+    incremental runs stop before it.
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        while position > floor:
+            step = min(64 * 1024, position - floor)
+            position -= step
+            f.seek(position)
+            newline = f.read(step).rfind(b'\n')
+            if newline >= 0:
+                return position + newline + 1
+    return floor
+
+def file_fingerprint(path: str, length: int) -> str:
+    """Hash of the first bytes of a file, used to detect replaced or rotated files."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read(min(length, 4096))).hexdigest()
+
+def _analyze_shard(data_dir: str, path: str, start: int, end: int, chunk_size: int,
+                   ingest: bool = False) -> 'ProgressAggregate':
+    """Process pool entry point: aggregate one byte range of a codes file."""
+    analyzer = ProgressAnalyzer(data_dir)
+    aggregate = ProgressAggregate()
+    for chunk in iter_code_chunks(path, chunk_size, start, end):
+        decoded = analyzer.decode_progress_codes_bulk(chunk)
+        aggregate.update(decoded)
+        if ingest:
+            analyzer.store.ingest(decoded)
+    return aggregate
+
 class ProgressAnalyzer:
     def __init__(self, data_dir: str = "data"):
         """Initialize the progress analyzer."""
@@ -32,73 +725,260 @@ class ProgressAnalyzer:
         self.analytics_dir.mkdir(parents=True, exist_ok=True)
         self.exports_dir.mkdir(parents=True, exist_ok=True)
         
+        self.store = ProgressStore(self.analytics_dir / 'progress_store')
+        # Minimum dashboard grids; see curriculum_shapes
+        self.heatmap_shape = WEEK_GRID
+        self.day_heatmap_shape = DAY_GRID
+        
         self.progress_data = []
         self.analytics = {}
         
     def decode_progress_code(self, code: str) -> Optional[Dict]:
         """Decode a progress code to extract user data."""
         try:
-            # Format: HAMPTON-PROJ-W#M#-XXXX-YYYY
+            # Format: HAMPTON-PROJ-W#M#-XXXX-YYYY or HAMPTON-PROJ-D#L#-XXXX-YYYY
             parts = code.upper().strip().split('-')
             
+            if parts[0] == V2_PREFIX:
+                return self.decode_progress_code_v2(code)
+            
             if len(parts) != 5 or parts[0] != 'HAMPTON':
                 return None
             
-            project_map = {
-                'DASH': 'dashboard',
-                'BLOG': 'blog',
-                'AUTO': 'automation'
-            }
+            project = PROJECT_CODE_MAP.get(parts[1], 'unknown')
             
-            project = project_map.get(parts[1], 'unknown')
-            
-            # Parse week and module
-            week_module = parts[2]
-            if week_module.startswith('W') and 'M' in week_module:
-                week_part, module_part = week_module[1:].split('M')
+            # Parse week and module, or day and (0-based) lesson
+            position = parts[2]
+            week = module = day = lesson = 0
+            if position.startswith('W') and 'M' in position:
+                week_part, module_part = position[1:].split('M')
                 week = int(week_part)
                 module = int(module_part)
-            else:
-                week = module = 0
+            elif position.startswith('D') and 'L' in position:
+                day_part, lesson_part = position[1:].split('L')
+                day = int(day_part)
+                lesson = int(lesson_part) + 1
             
             return {
                 'code': code,
                 'project': project,
                 'week': week,
                 'module': module,
+                'day': day,
+                'lesson': lesson,
                 'checksum': parts[3],
                 'data': parts[4],
-                'decoded_at': datetime.now().isoformat()
+                'decoded_at': datetime.now().isoformat(),
+                'checksum_valid': verify_progress_checksum(parts[1], parts[3]),
+                # Version 1 payloads only keep the start of the JSON, so these
+                # fields can't be recovered
+                'xp': None,
+                'achievements': None,
+                'completed_modules': None
             }
         except Exception as e:
             click.echo(f"Error decoding {code}: {e}", err=True)
             return None
     
-    def analyze_progress_codes(self, codes: List[str]) -> Dict:
-        """Analyze a list of progress codes."""
-        decoded = [self.decode_progress_code(code) for code in codes]
-        valid_codes = [d for d in decoded if d is not None]
+    def decode_progress_code_v2(self, code: str) -> Optional[Dict]:
+        """Decode a version 2 progress code including XP and counters."""
+        match = re.match(V2_PATTERN, code.upper().strip())
+        if not match:
+            return None
+        
+        body = ''.join(match.groups()[:4])
+        record = dict(zip(V2_FIELDS, V2_STRUCT.unpack(base64.b32decode(body + '===='))))
+        if record['version'] != V2_VERSION or record['project'] >= len(V2_PROJECT_CODES):
+            return None
+        
+        return {
+            'code': code,
+            'project': PROJECT_CODE_MAP[V2_PROJECT_CODES[record['project']]],
+            'week': int(record['week']),
+            'module': int(record['module']),
+            'day': 0,
+            'lesson': 0,
+            'checksum': match.group(5),
+            'data': body,
+            'decoded_at': datetime.now().isoformat(),
+            'checksum_valid': generate_checksum(body)[:4] == match.group(5),
+            'xp': int(record['xp']),
+            'achievements': int(record['achievements']),
+            'completed_modules': int(record['completed_modules'])
+        }
+    
+    def decode_progress_codes_bulk(self, codes: Iterable[str]) -> pd.DataFrame:
+        """Decode many progress codes at once.
         
-        if not valid_codes:
-            return {'error': 'No valid codes found'}
+        Returns one row per input code with the same fields as
+        decode_progress_code, plus a boolean 'valid' column. Invalid rows
+        carry zero positions, missing strings and checksum_valid False.
+        """
+        import numpy as np
+        import pandas as pd
+        raw = pd.Series(list(codes), dtype=object)
         
-        df = pd.DataFrame(valid_codes)
+        # Progress codes repeat heavily, so decode each distinct code once
+        # and broadcast the results back to every row
+        row_index, uniques = pd.factorize(raw)
+        unique_codes = pd.Series(np.append(np.asarray(uniques, dtype=object), None), dtype=object)
+        row_index = np.where(row_index < 0, len(uniques), row_index)
         
-        analytics = {
-            'total_codes': len(codes),
-            'valid_codes': len(valid_codes),
-            'invalid_codes': len(codes) - len(valid_codes),
-            'project_distribution': df['project'].value_counts().to_dict(),
-            'average_week': df['week'].mean(),
-            'average_module': df['module'].mean(),
-            'furthest_progress': {
-                'week': df['week'].max(),
-                'module': df.loc[df['week'] == df['week'].max(), 'module'].max()
-            },
-            'completion_rate': (df['week'] * 5 + df['module']).mean() / 40 * 100  # 40 total modules
+        normalized = unique_codes.str.upper().str.strip()
+        parts = normalized.str.extract(CODE_PATTERN)
+        valid = parts[0].notna().to_numpy().copy()
+        
+        matched = parts[2].notna()
+        week = pd.to_numeric(parts[2].where(matched, '0'))
+        module = pd.to_numeric(parts[3].where(matched, '0'))
+        day_matched = parts[4].notna()
+        day = pd.to_numeric(parts[4].where(day_matched, '0'))
+        lesson = pd.to_numeric(parts[5].where(day_matched, '-1')) + 1
+        
+        # Anything shaped like W#M# or D#L# that the fast path can't read is
+        # left to the scalar decoder so both paths agree on edge cases
+        fallback = (((parts[1].str.startswith('W') & parts[1].str.contains('M', regex=False))
+                     | (parts[1].str.startswith('D') & parts[1].str.contains('L', regex=False)))
+                    & ~matched & ~day_matched).fillna(False).to_numpy()
+        
+        project = parts[0].map(PROJECT_CODE_MAP).where(parts[0].notna())
+        project = project.where(project.notna() | ~valid, 'unknown')
+        checksum = parts[6]
+        data = parts[7]
+        
+        if fallback.any():
+            for i in np.flatnonzero(fallback):
+                decoded = self.decode_progress_code(unique_codes.iat[i])
+                if decoded is None:
+                    valid[i] = False
+                else:
+                    week.iat[i] = decoded['week']
+                    module.iat[i] = decoded['module']
+                    day.iat[i] = decoded['day']
+                    lesson.iat[i] = decoded['lesson']
+        
+        # The v1 checksum only depends on the project code, so it is
+        # computed once per distinct project segment
+        project_index, project_codes = pd.factorize(parts[0].fillna(''))
+        payloads = [progress_payload(code) for code in project_codes]
+        expected = pd.Series(generate_checksums_bulk(payloads), dtype=object).str[:4].to_numpy()
+        checksum_valid = valid & (checksum.to_numpy() == expected[project_index])
+        
+        # Version 2 codes carry the payload fields; v1 rows leave them missing
+        xp = pd.Series(pd.NA, index=unique_codes.index, dtype='UInt32')
+        achievements = pd.Series(pd.NA, index=unique_codes.index, dtype='UInt16')
+        completed_modules = pd.Series(pd.NA, index=unique_codes.index, dtype='UInt16')
+        v2 = decode_progress_codes_v2_bulk(normalized)
+        if len(v2):
+            rows = v2.index.to_numpy()
+            valid[rows] = True
+            checksum_valid[rows] = v2['checksum_valid'].to_numpy()
+            project.loc[rows] = v2['project']
+            week.loc[rows] = v2['week']
+            module.loc[rows] = v2['module']
+            checksum.loc[rows] = v2['checksum']
+            data.loc[rows] = v2['data']
+            xp.loc[rows] = v2['xp']
+            achievements.loc[rows] = v2['achievements']
+            completed_modules.loc[rows] = v2['completed_modules']
+        
+        decoded = pd.DataFrame({
+            'project': project.where(valid).astype('category'),
+            'week': pd.to_numeric(week.where(valid, 0), downcast='unsigned'),
+            'module': pd.to_numeric(module.where(valid, 0), downcast='unsigned'),
+            'day': pd.to_numeric(day.where(valid, 0), downcast='unsigned'),
+            'lesson': pd.to_numeric(lesson.where(valid, 0), downcast='unsigned'),
+            'checksum': checksum.where(valid).astype('category'),
+            'data': data.where(valid).astype('category'),
+            'checksum_valid': checksum_valid,
+            'xp': xp,
+            'achievements': achievements,
+            'completed_modules': completed_modules,
+            'valid': valid
+        }).take(row_index).reset_index(drop=True)
+        
+        decoded.insert(0, 'code', raw)
+        decoded.insert(8, 'decoded_at', pd.Categorical([datetime.now().isoformat()] * len(raw)))
+        return decoded
+    
+    def analyze_progress_codes(self, codes: Optional[Iterable[str]] = None) -> Dict:
+        """Analyze a list of progress codes.
+        
+        Without codes, analyzes everything in the progress store.
+        """
+        aggregate = ProgressAggregate()
+        if codes is None:
+            aggregate.update(self.store.to_frame())
+        else:
+            aggregate.update(self.decode_progress_codes_bulk(codes))
+        return aggregate.to_analytics()
+    
+    def analyze_codes_file(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           workers: int = 1, ingest: bool = False,
+                           start: int = 0, end: Optional[int] = None) -> ProgressAggregate:
+        """Stream a codes file chunk by chunk into a running aggregate.
+        
+        With workers > 1 the file is sharded by byte range and each shard is
+        aggregated in a separate process before the partials are merged.
+        With ingest, decoded codes are also appended to the progress store,
+        which requires a single worker. start/end restrict the analysis to
+        lines starting in that byte range.
+        """
+        if workers <= 1:
+            return _analyze_shard(str(self.data_dir), path, start, end, chunk_size, ingest)
+        if ingest:
+            raise ValueError("Ingesting into the progress store requires a single worker")
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        ranges = split_byte_ranges(path, workers, start, end)
+        aggregate = ProgressAggregate()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_analyze_shard, str(self.data_dir), path, start, end, chunk_size)
+                       for start, end in ranges]
+            for future in futures:
+                aggregate.merge(future.result())
+        return aggregate
+    
+    def analyze_codes_file_incremental(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                       workers: int = 1, ingest: bool = False,
+                                       rebuild: bool = False) -> Tuple[ProgressAggregate, int]:
+        """Analyze only the lines appended to a codes file since the last run.
+        
+        The byte-offset watermark and running aggregate are kept in
+        data/analytics/watermarks.json. A shrunken or replaced file, or
+        rebuild, starts over from the beginning. Returns the updated
+        aggregate and the number of bytes processed.
+        """
+        watermarks_path = self.analytics_dir / 'watermarks.json'
+        watermarks = {}
+        if watermarks_path.exists():
+            with open(watermarks_path, 'r') as f:
+                watermarks = json.load(f)
+        
+        key = str(Path(path).resolve())
+        state = watermarks.get(key)
+        size = os.path.getsize(path)
+        if (rebuild or state is None or size < state['offset']
+                or file_fingerprint(path, state['offset']) != state['fingerprint']):
+            aggregate, offset = ProgressAggregate(), 0
+        else:
+            aggregate, offset = ProgressAggregate.from_dict(state['aggregate']), state['offset']
+        
+        end = complete_lines_end(path, offset)
+        if end > offset:
+            aggregate.merge(self.analyze_codes_file(path, chunk_size, workers, ingest, offset, end))
+        
+        watermarks[key] = {
+            'offset': end,
+            'fingerprint': file_fingerprint(path, end),
+            'updated_at': datetime.now().isoformat(),
+            'aggregate': aggregate.to_dict()
         }
+        with open(watermarks_path, 'w') as f:
+            json.dump(watermarks, f, indent=2)
         
-        return analytics
+        return aggregate, end - offset
     
     def generate_user_report(self, progress_code: str) -> Dict:
         """Generate a detailed report for a single user."""
@@ -107,8 +987,16 @@ class ProgressAnalyzer:
         if not decoded:
             return {'error': 'Invalid progress code'}
         
-        total_modules = (decoded['week'] - 1) * 5 + decoded['module']
-        total_possible = 40  # 8 weeks * 5 modules
+        # Version 2 codes carry real counters; otherwise estimate from position
+        position, total_possible = self.position_progress(decoded)
+        if decoded['completed_modules'] is not None:
+            total_modules = decoded['completed_modules']
+        else:
+            total_modules = position
+        if decoded['xp'] is not None:
+            xp, xp_source = decoded['xp'], 'code'
+        else:
+            xp, xp_source = total_modules * 100, 'estimate'  # Base XP per module
         
         report = {
             'user_progress': decoded,
@@ -116,8 +1004,10 @@ class ProgressAnalyzer:
                 'modules_completed': total_modules,
                 'total_modules': total_possible,
                 'completion_percentage': (total_modules / total_possible) * 100,
-                'estimated_xp': total_modules * 100,  # Base XP per module
-                'estimated_level': int(np.sqrt(total_modules * 100 / 50)) + 1
+                'estimated_xp': xp,
+                'xp_source': xp_source,
+                'achievements': decoded['achievements'],
+                'estimated_level': int(math.sqrt(xp / 50)) + 1
             },
             'recommendations': self.generate_recommendations(decoded),
             'estimated_completion': self.estimate_completion_date(decoded),
@@ -126,6 +1016,12 @@ class ProgressAnalyzer:
         
         return report
     
+    def position_progress(self, user_data: Dict) -> Tuple[int, int]:
+        """Modules reached and in total (8 weeks * 5), or lessons for day codes (30 days * 4)."""
+        if user_data.get('day'):
+            return (user_data['day'] - 1) * DAY_GRID[1] + user_data['lesson'], DAY_GRID[0] * DAY_GRID[1]
+        return (user_data['week'] - 1) * 5 + user_data['module'], 40
+    
     def generate_recommendations(self, user_data: Dict) -> List[str]:
         """Generate personalized recommendations based on progress."""
         recommendations = []
@@ -174,8 +1070,8 @@ class ProgressAnalyzer:
             "weekend": 7    # Weekend warrior - 1 module per week
         }
         
-        current_position = (user_data['week'] - 1) * 5 + user_data['module']
-        remaining_modules = 40 - current_position
+        current_position, total = self.position_progress(user_data)
+        remaining_modules = total - current_position
         
         estimates = {}
         for pace_name, days_per_module in pace_days.items():
@@ -195,6 +1091,20 @@ class ProgressAnalyzer:
         week = user_data['week']
         module = user_data['module']
         
+        if user_data.get('day'):
+            # 30-day curricula: the next milestone is finishing the current day
+            day, lesson = user_data['day'], user_data['lesson']
+            if lesson >= DAY_GRID[1]:
+                day, lesson = day + 1, 0
+            if day <= DAY_GRID[0]:
+                return {
+                    'name': f"Complete Day {day}",
+                    'description': f"Day {day} of {DAY_GRID[0]}",
+                    'day': day,
+                    'modules_remaining': DAY_GRID[1] - lesson
+                }
+            week, module = 8, 5  # Past the last milestone
+        
         milestones = [
             (1, 5, "Complete Week 1", "Foundation Complete"),
             (2, 5, "Complete Week 2", "Basic Structure Built"),
@@ -223,77 +1133,173 @@ class ProgressAnalyzer:
             'modules_remaining': 0
         }
     
-    def generate_analytics_dashboard(self, data: List[Dict]) -> None:
-        """Generate visual analytics dashboard."""
+    def generate_analytics_dashboard(self, data: Optional[List[Dict]] = None,
+                                     aggregate: Optional[ProgressAggregate] = None,
+                                     headless: bool = False, format: str = 'png') -> Optional[Path]:
+        """Generate visual analytics dashboard.
+        
+        Renders from pre-aggregated counts, so the cost doesn't depend on
+        the number of users. Raw decoded codes (dicts or a DataFrame) are
+        aggregated first; with neither, the progress store is used.
+        Headless mode renders with the Agg backend and never opens a
+        window. format is 'png', 'svg' or 'html' (a static page with the
+        SVG figure and the analytics summary).
+        """
+        import pandas as pd
         
-        if not data:
+        if aggregate is None:
+            if data is None:
+                df = self.store.to_frame()
+            else:
+                df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+            for column, default in (('valid', True), ('checksum_valid', True), ('xp', pd.NA),
+                                    ('day', 0), ('lesson', 0)):
+                if column not in df.columns:
+                    df = df.assign(**{column: default})
+            aggregate = ProgressAggregate()
+            if not df.empty:
+                aggregate.update(df)
+        
+        if not aggregate.valid_codes:
             click.echo("No data to visualize", err=True)
             return
         
-        df = pd.DataFrame(data)
+        heatmap = pad_grid(aggregate.heatmap, *self.heatmap_shape)
+        rows, cols = heatmap.shape
+        day_heatmap = pad_grid(aggregate.day_heatmap, *self.day_heatmap_shape)
+        
+        # Plotting libraries are only needed here, so they aren't imported
+        # at module load
+        import matplotlib
+        if headless or format == 'html':
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         
         # Set up the plot style
         sns.set_style("whitegrid")
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        # Day/lesson codes from the 30-day curricula get a row of their own
+        panel_rows = 3 if aggregate.day_codes else 2
+        fig, axes = plt.subplots(panel_rows, 2, figsize=(15, 5 * panel_rows))
         fig.suptitle('Project Hampton - Progress Analytics', fontsize=16)
         
         # 1. Project Distribution
-        if 'project' in df.columns:
-            project_counts = df['project'].value_counts()
-            axes[0, 0].pie(project_counts.values, labels=project_counts.index, autopct='%1.1f%%')
-            axes[0, 0].set_title('Project Distribution')
+        project_counts = pd.Series(aggregate.project_counts).sort_values(ascending=False)
+        axes[0, 0].pie(project_counts.values, labels=project_counts.index, autopct='%1.1f%%')
+        axes[0, 0].set_title('Project Distribution')
         
         # 2. Progress Distribution
-        if 'week' in df.columns:
-            axes[0, 1].hist(df['week'], bins=8, edgecolor='black')
-            axes[0, 1].set_xlabel('Week')
-            axes[0, 1].set_ylabel('Number of Users')
-            axes[0, 1].set_title('User Progress Distribution')
-            axes[0, 1].set_xticks(range(1, 9))
+        week_counts = heatmap.sum(axis=1)
+        axes[0, 1].bar(range(1, rows + 1), week_counts, width=1.0, edgecolor='black')
+        axes[0, 1].set_xlabel('Week')
+        axes[0, 1].set_ylabel('Number of Users')
+        axes[0, 1].set_title('User Progress Distribution')
+        axes[0, 1].set_xticks(range(1, rows + 1))
         
         # 3. Completion Rate by Project
-        if 'project' in df.columns and 'week' in df.columns:
-            completion_by_project = df.groupby('project').agg({
-                'week': 'mean',
-                'module': 'mean'
-            })
-            completion_by_project['completion_rate'] = (completion_by_project['week'] * 5 + completion_by_project['module']) / 40 * 100
-            
-            axes[1, 0].bar(completion_by_project.index, completion_by_project['completion_rate'])
-            axes[1, 0].set_ylabel('Completion Rate (%)')
-            axes[1, 0].set_title('Average Completion by Project')
+        completion_by_project = pd.Series({
+            project: (week_sum * 5 + module_sum) / aggregate.project_week_codes[project] / 40 * 100
+            for project, (week_sum, module_sum) in aggregate.project_position_sums.items()
+        })
+        axes[1, 0].bar(completion_by_project.index, completion_by_project.values)
+        axes[1, 0].set_ylabel('Completion Rate (%)')
+        axes[1, 0].set_title('Average Completion by Project')
         
         # 4. Module Progress Heatmap
-        if 'week' in df.columns and 'module' in df.columns:
-            progress_matrix = np.zeros((8, 5))
-            for _, row in df.iterrows():
-                week = int(row['week']) - 1
-                module = int(row['module']) - 1
-                if 0 <= week < 8 and 0 <= module < 5:
-                    progress_matrix[week, module] += 1
+        im = axes[1, 1].imshow(heatmap, cmap='YlOrRd', aspect='auto')
+        axes[1, 1].set_xlabel('Module')
+        axes[1, 1].set_ylabel('Week')
+        axes[1, 1].set_title('Module Completion Heatmap')
+        axes[1, 1].set_xticks(range(cols))
+        axes[1, 1].set_yticks(range(rows))
+        axes[1, 1].set_xticklabels([f'M{i+1}' for i in range(cols)])
+        axes[1, 1].set_yticklabels([f'W{i+1}' for i in range(rows)])
+        plt.colorbar(im, ax=axes[1, 1])
+        
+        # 5-6. Daily curricula
+        if aggregate.day_codes:
+            days, lessons = day_heatmap.shape
+            axes[2, 0].bar(range(1, days + 1), day_heatmap.sum(axis=1), width=1.0, edgecolor='black')
+            axes[2, 0].set_xlabel('Day')
+            axes[2, 0].set_ylabel('Number of Users')
+            axes[2, 0].set_title('Daily Curriculum Progress')
             
-            im = axes[1, 1].imshow(progress_matrix, cmap='YlOrRd', aspect='auto')
-            axes[1, 1].set_xlabel('Module')
-            axes[1, 1].set_ylabel('Week')
-            axes[1, 1].set_title('Module Completion Heatmap')
-            axes[1, 1].set_xticks(range(5))
-            axes[1, 1].set_yticks(range(8))
-            axes[1, 1].set_xticklabels([f'M{i+1}' for i in range(5)])
-            axes[1, 1].set_yticklabels([f'W{i+1}' for i in range(8)])
-            plt.colorbar(im, ax=axes[1, 1])
+            im = axes[2, 1].imshow(day_heatmap, cmap='YlOrRd', aspect='auto')
+            axes[2, 1].set_xlabel('Lesson')
+            axes[2, 1].set_ylabel('Day')
+            axes[2, 1].set_title('Lesson Completion Heatmap')
+            axes[2, 1].set_xticks(range(lessons))
+            axes[2, 1].set_xticklabels([f'L{i+1}' for i in range(lessons)])
+            axes[2, 1].set_yticks(range(0, days, 5))
+            axes[2, 1].set_yticklabels([f'D{i+1}' for i in range(0, days, 5)])
+            plt.colorbar(im, ax=axes[2, 1])
         
         plt.tight_layout()
         
         # Save the dashboard
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        dashboard_path = self.analytics_dir / f'dashboard_{timestamp}.png'
-        plt.savefig(dashboard_path, dpi=150, bbox_inches='tight')
+        dashboard_path = self.analytics_dir / f'dashboard_{timestamp}.{format}'
+        if format == 'html':
+            svg = io.StringIO()
+            plt.savefig(svg, format='svg', bbox_inches='tight')
+            with open(dashboard_path, 'w', encoding='utf-8') as f:
+                f.write(self._render_dashboard_html(aggregate, svg.getvalue(), timestamp))
+        else:
+            plt.savefig(dashboard_path, format=format, dpi=150, bbox_inches='tight')
         click.echo(f"✓ Dashboard saved to {dashboard_path}")
         
-        plt.show()
+        if headless or format == 'html':
+            plt.close(fig)
+        else:
+            plt.show()
+        return dashboard_path
+    
+    def _render_dashboard_html(self, aggregate: ProgressAggregate, svg: str, timestamp: str) -> str:
+        """Static HTML dashboard: inline SVG figure plus the analytics summary."""
+        analytics = aggregate.to_analytics()
+        rows = "".join(
+            f"<tr><td>{html.escape(str(project).title())}</td><td>{count}</td></tr>"
+            for project, count in analytics['project_distribution'].items()
+        )
+        summary = [f"Valid codes: {analytics['valid_codes']}/{analytics['total_codes']}"]
+        if analytics['week_codes']:
+            summary.append(f"Average completion: {analytics['completion_rate']:.1f}%")
+            summary.append(f"Average position: Week {analytics['average_week']:.1f}")
+        if analytics['daily']['codes']:
+            summary.append(f"Average daily position: Day {analytics['daily']['average_day']:.1f}")
+        # Drop the XML prolog so the SVG can be inlined
+        svg = svg[svg.index('<svg'):]
+        return f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Progress Dashboard - {timestamp}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        table {{ border-collapse: collapse; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #001689; color: white; }}
+        svg {{ max-width: 100%; height: auto; }}
+    </style>
+</head>
+<body>
+    <h1>Project Hampton - Progress Dashboard</h1>
+    <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+    <p>{' &middot; '.join(summary)}</p>
+    <table>
+        <tr><th>Project</th><th>Users</th></tr>
+        {rows}
+    </table>
+    {svg}
+</body>
+</html>
+"""
     
     def export_data(self, data: Any, format: str, filename: str = None) -> Path:
         """Export data in various formats."""
+        if format != 'json':
+            # Single-code reports export JSON, so they never pay for pandas
+            import pandas as pd
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = filename or f'progress_export_{timestamp}'
@@ -360,6 +1366,21 @@ class ProgressAnalyzer:
         
         return filepath
 
+def describe_position(decoded: Dict) -> str:
+    if decoded['day']:
+        return f"Day {decoded['day']}, Lesson {decoded['lesson']}"
+    return f"Week {decoded['week']}, Module {decoded['module']}"
+
+def echo_positions(analytics: Dict) -> None:
+    """Print the weekly and daily position summaries that have codes."""
+    if analytics['week_codes']:
+        click.echo(f"Average Completion: {analytics['completion_rate']:.1f}%")
+        click.echo(f"Average Position: Week {analytics['average_week']:.1f}")
+    daily = analytics['daily']
+    if daily['codes']:
+        click.echo(f"Daily Curricula: {daily['codes']} codes, {daily['completion_rate']:.1f}% average completion")
+        click.echo(f"Average Daily Position: Day {daily['average_day']:.1f}")
+
 @click.command()
 @click.option('--code', '-c', help='Analyze a single progress code')
 @click.option('--codes-file', '-f', help='File containing progress codes (one per line)')
@@ -367,11 +1388,30 @@ class ProgressAnalyzer:
               type=click.Choice(['json', 'csv', 'excel', 'html']), 
               default='json', help='Export format')
 @click.option('--visualize', '-v', is_flag=True, help='Generate visual analytics')
+@click.option('--headless', is_flag=True, help='Render dashboards without opening a window (for cron jobs)')
+@click.option('--dashboard-format', type=click.Choice(['png', 'svg', 'html']), default='png',
+              show_default=True, help='Dashboard output format')
 @click.option('--report', '-r', is_flag=True, help='Generate detailed report')
-def main(code, codes_file, export_format, visualize, report):
+@click.option('--stream', is_flag=True, help='Stream the codes file in chunks (aggregates only, flat memory)')
+@click.option('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, show_default=True,
+              help='Codes decoded per chunk in streaming mode')
+@click.option('--workers', type=int, default=1, show_default=True,
+              help='Processes used to analyze the codes file (implies --stream when > 1)')
+@click.option('--ingest', is_flag=True, help='Store decoded codes in the persistent progress store')
+@click.option('--from-store', is_flag=True, help='Analyze the progress store instead of a codes file')
+@click.option('--incremental', is_flag=True, help='Only analyze lines appended since the last run (implies --stream)')
+@click.option('--rebuild', is_flag=True, help='Discard the incremental watermark and start over')
+@click.option('--curriculum', type=click.Path(exists=True, dir_okay=False),
+              help='Curriculum JSON whose weeks/days set the dashboard grid')
+def main(code, codes_file, export_format, visualize, headless, dashboard_format, report, stream,
+         chunk_size, workers, ingest, from_store, incremental, rebuild, curriculum):
     """Analyze Project Hampton progress codes and generate insights."""
     
     analyzer = ProgressAnalyzer()
+    if curriculum:
+        shapes = curriculum_shapes(curriculum)
+        analyzer.heatmap_shape = shapes.get('weeks', analyzer.heatmap_shape)
+        analyzer.day_heatmap_shape = shapes.get('days', analyzer.day_heatmap_shape)
     
     click.echo("📊 Project Hampton Progress Analyzer")
     click.echo("=" * 40)
@@ -392,10 +1432,14 @@ def main(code, codes_file, export_format, visualize, report):
             else:
                 stats = result['statistics']
                 click.echo(f"Project: {result['user_progress']['project'].title()}")
-                click.echo(f"Current Position: Week {result['user_progress']['week']}, Module {result['user_progress']['module']}")
+                click.echo(f"Current Position: {describe_position(result['user_progress'])}")
                 click.echo(f"Completion: {stats['completion_percentage']:.1f}%")
                 click.echo(f"Estimated Level: {stats['estimated_level']}")
-                click.echo(f"Estimated XP: {stats['estimated_xp']}")
+                if stats['xp_source'] == 'code':
+                    click.echo(f"XP: {stats['estimated_xp']}")
+                    click.echo(f"Achievements: {stats['achievements']}")
+                else:
+                    click.echo(f"Estimated XP: {stats['estimated_xp']}")
                 
                 click.echo("\n🎯 Next Milestone:")
                 milestone = result['next_milestone']
@@ -419,7 +1463,8 @@ def main(code, codes_file, export_format, visualize, report):
             if decoded:
                 click.echo(f"✓ Valid code")
                 click.echo(f"  Project: {decoded['project']}")
-                click.echo(f"  Progress: Week {decoded['week']}, Module {decoded['module']}")
+                click.echo(f"  Progress: {describe_position(decoded)}")
+                click.echo(f"  Checksum: {'verified' if decoded['checksum_valid'] else 'mismatch'}")
             else:
                 click.echo("✗ Invalid code", err=True)
     
@@ -427,53 +1472,101 @@ def main(code, codes_file, export_format, visualize, report):
         # Multiple codes analysis
         click.echo(f"\nAnalyzing codes from: {codes_file}")
         
+        stream = stream or workers > 1 or incremental
+        if ingest and workers > 1:
+            raise click.UsageError("--ingest can't be combined with --workers > 1")
+        
         try:
-            with open(codes_file, 'r') as f:
-                codes = [line.strip() for line in f if line.strip()]
-            
-            click.echo(f"Found {len(codes)} codes")
-            
-            # Decode all codes
-            decoded_codes = []
-            for code in codes:
-                decoded = analyzer.decode_progress_code(code)
-                if decoded:
-                    decoded_codes.append(decoded)
+            if incremental:
+                aggregate, processed = analyzer.analyze_codes_file_incremental(
+                    codes_file, chunk_size, workers, ingest, rebuild)
+                decoded_codes = []
+                click.echo(f"Processed {processed} new bytes, {aggregate.total_codes} codes in total")
+            elif stream:
+                aggregate = analyzer.analyze_codes_file(codes_file, chunk_size, workers, ingest)
+                decoded_codes = []
+                click.echo(f"Found {aggregate.total_codes} codes")
+            else:
+                with open(codes_file, 'r') as f:
+                    codes = [line.strip() for line in f if line.strip()]
+                
+                click.echo(f"Found {len(codes)} codes")
+                
+                # Decode all codes once; analytics and exports share the result
+                decoded = analyzer.decode_progress_codes_bulk(codes)
+                aggregate = ProgressAggregate()
+                aggregate.update(decoded)
+                if ingest:
+                    added = analyzer.store.ingest(decoded)
+                    click.echo(f"Stored {added} new codes")
+                verified = decoded['valid'] & decoded['checksum_valid']
+                decoded = decoded[verified].drop(columns=['valid', 'checksum_valid']).astype(object)
+                decoded_codes = decoded.where(decoded.notna(), None).to_dict('records')
             
             # Generate analytics
-            analytics = analyzer.analyze_progress_codes(codes)
+            analytics = aggregate.to_analytics()
+            if 'error' in analytics:
+                click.echo(f"❌ {analytics['error']}", err=True)
+                return
             
             click.echo("\n📊 Analytics Summary")
             click.echo("-" * 30)
             click.echo(f"Valid Codes: {analytics['valid_codes']}/{analytics['total_codes']}")
-            click.echo(f"Average Completion: {analytics['completion_rate']:.1f}%")
-            click.echo(f"Average Position: Week {analytics['average_week']:.1f}")
+            click.echo(f"Invalid Checksums: {analytics['invalid_checksums']}")
+            echo_positions(analytics)
+            if analytics['payload']['codes']:
+                click.echo(f"Average XP: {analytics['payload']['average_xp']:.0f} "
+                           f"({analytics['payload']['codes']} codes with payload)")
             
             click.echo("\n🎯 Project Distribution:")
             for project, count in analytics['project_distribution'].items():
                 click.echo(f"  {project.title()}: {count} users")
             
             # Visualize if requested
-            if visualize and decoded_codes:
-                analyzer.generate_analytics_dashboard(decoded_codes)
+            if visualize:
+                analyzer.generate_analytics_dashboard(aggregate=aggregate, headless=headless,
+                                                      format=dashboard_format)
             
             # Export
-            export_data = {
-                'analytics': analytics,
-                'codes': decoded_codes
-            }
-            filepath = analyzer.export_data(export_data, export_format)
+            export_data = {'analytics': analytics}
+            if not stream:
+                export_data['codes'] = decoded_codes
+            # Incremental runs keep refreshing one export per codes file
+            filename = f'{Path(codes_file).stem}_incremental' if incremental else None
+            filepath = analyzer.export_data(export_data, export_format, filename)
             click.echo(f"\n✅ Analytics exported to {filepath}")
             
         except FileNotFoundError:
             click.echo(f"❌ File not found: {codes_file}", err=True)
     
+    elif from_store:
+        # Query previously ingested codes without re-parsing text
+        click.echo(f"\nAnalyzing progress store: {analyzer.store.store_dir}")
+        analytics = analyzer.analyze_progress_codes()
+        if 'error' in analytics:
+            click.echo(f"❌ {analytics['error']}", err=True)
+            return
+        
+        click.echo(f"Stored Codes: {analytics['total_codes']}")
+        echo_positions(analytics)
+        
+        if visualize:
+            analyzer.generate_analytics_dashboard(headless=headless, format=dashboard_format)
+        
+        filepath = analyzer.export_data({'analytics': analytics}, export_format)
+        click.echo(f"\n✅ Analytics exported to {filepath}")
+    
     else:
         click.echo("\nUsage:")
         click.echo("  Analyze single code: python progress_analyzer.py -c HAMPTON-DASH-W3M2-XXXX-YYYY")
         click.echo("  Analyze multiple codes: python progress_analyzer.py -f codes.txt")
         click.echo("  Generate report: python progress_analyzer.py -c [CODE] -r")
         click.echo("  Visualize data: python progress_analyzer.py -f codes.txt -v")
+        click.echo("  Stream a huge file: python progress_analyzer.py -f codes.txt --stream")
+        click.echo("  Use several cores: python progress_analyzer.py -f codes.txt --workers 8")
+        click.echo("  Hourly re-runs: python progress_analyzer.py -f codes.txt --incremental")
+        click.echo("  Store decoded codes: python progress_analyzer.py -f codes.txt --ingest")
+        click.echo("  Analyze stored codes: python progress_analyzer.py --from-store")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""Shared pytest setup for the Project Hampton helper scripts."""
+
+import sys
+from pathlib import Path
+
+# The scripts are run directly rather than installed, so import them from
+# their own directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
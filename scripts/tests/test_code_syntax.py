@@ -0,0 +1,75 @@
+"""Tests for the code example syntax checks in code_syntax.py."""
+
+import pytest
+
+from code_syntax import check_snippet, detect_language
+
+@pytest.mark.parametrize('code', [
+    'const half = total / 2; const ratio = (a + b) / (c - d);',
+    'total++ / n;',
+    'count-- / 2;',
+    'const next = items[i++] / scale;',
+    'const pattern = /[/(]+\\)?/g; parts = path.split(pattern);',
+    'if (/^\\d+$/.test(value)) { return /x/.source; }',
+    "const html = '<div>' + name + '</div>'; el.innerHTML = html;",
+    'const s = `total: ${items.map((i) => `(${i})`).join(", ")} {not a brace`;',
+    'const s = `line one\nline two ${ {a: 1}.a }`;',
+    '/* unbalanced ( in a comment */ call(); // and ( here',
+])
+def test_valid_javascript(code):
+    assert check_snippet(code, 'javascript') == []
+
+@pytest.mark.parametrize('code, issue', [
+    ('const x = (1 + 2;', "Unclosed '(' from line 1"),
+    ('call(a]);', "Unexpected ']' at line 1"),
+    ('const re = /abc', 'Unterminated regular expression at line 1'),
+    ("const s = 'abc;", 'Unterminated string at line 1'),
+    ('const s = `abc\n${x}', 'Unterminated template literal from line 1'),
+    ('const s = `${a(`;', 'Unterminated template literal from line 1'),
+    ('/* never closed', 'Unterminated comment at line 1'),
+])
+def test_invalid_javascript(code, issue):
+    assert check_snippet(code, 'javascript') == [issue]
+
+@pytest.mark.parametrize('code', [
+    'return <div>{x}</div>;',
+    'const App = () => <div className="app">{items.length / 2}</div>;',
+    'return (\n  <>\n    <Header />\n  </>\n);',
+])
+def test_jsx_is_not_checked(code):
+    assert detect_language(code) == 'jsx'
+    assert check_snippet(code) == []
+    assert check_snippet(code, 'jsx') == []
+
+def test_comparison_is_not_jsx():
+    assert detect_language('if (a < b) swap(a, b);') == 'javascript'
+
+@pytest.mark.parametrize('code', [
+    '<ul>\n  <li>One\n  <li>Two\n</ul>',
+    '<p>First<p>Second',
+    '<table><tr><td>a<td>b</table>',
+    '<!DOCTYPE html><html><body><br><img src="a.png"><input/></body></html>',
+    '<div><!-- <span> --></div>',
+    '<script>if (a < b) { run(); }</script><style>a { color: red; }</style>',
+])
+def test_valid_html(code):
+    assert check_snippet(code, 'html') == []
+
+@pytest.mark.parametrize('code, issue', [
+    ('<div><span></div>', 'Unclosed <span> from line 1'),
+    ('<div>\n</section>', 'Unexpected </section> at line 2'),
+    ('<section>', 'Unclosed <section> from line 1'),
+    ('<script>if (x {</script>', "In <script> from line 1: Unclosed '{' from line 1"),
+    ('<style>a { color: red;</style>', "In <style> from line 1: Unclosed '{' from line 1"),
+])
+def test_invalid_html(code, issue):
+    assert check_snippet(code, 'html') == [issue]
+
+def test_css_custom_properties():
+    assert check_snippet(':root { --gap: 4px; }\na { margin: calc(var(--gap) / 2); }', 'css') == []
+
+def test_python_and_json():
+    assert check_snippet('def f(x):\n    return x // 2', 'py') == []
+    assert check_snippet('def f(:', 'python') == ['Python syntax error at line 1: invalid syntax']
+    assert check_snippet('{"a": [1, 2]}') == []
+    assert check_snippet('{"a": [1, 2}', 'json')[0].startswith('JSON syntax error at line 1')
@@ -0,0 +1,71 @@
+"""Tests for content generation in content_generator.py."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from content_generator import MODULE_BATCH, PROJECT_TYPES, ContentGenerator
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+@pytest.fixture
+def config_path(tmp_path):
+    """The shipped config with content and data (manifest, template cache) under tmp_path."""
+    config = yaml.safe_load((SCRIPTS_DIR / 'config.yaml').read_text())
+    config['paths'].update(content=str(tmp_path / 'content'), data=str(tmp_path / 'data'))
+    path = tmp_path / 'config.yaml'
+    path.write_text(yaml.safe_dump(config))
+    return str(path)
+
+def tree_bytes(root: Path) -> dict:
+    return {str(path.relative_to(root)): path.read_bytes() for path in sorted(root.rglob('*')) if path.is_file()}
+
+def test_parallel_matrix_matches_serial(config_path, tmp_path):
+    trees = {}
+    for jobs in (1, 3):
+        generator = ContentGenerator(config_path)
+        generator.content_dir = tmp_path / f'jobs{jobs}'
+        _, timings = generator.generate_matrix(PROJECT_TYPES, quiz=True, jobs=jobs)
+        assert timings['skipped_weeks'] == 0
+        trees[jobs] = tree_bytes(generator.content_dir)
+
+    week_files = [name for name in trees[1] if '/modules_' in name]
+    assert len(week_files) == len(PROJECT_TYPES) * 8 * 2
+    # Five quizzes per week, shared by every project
+    assert len(trees[1]) - len(week_files) == 8 * 5
+    assert trees[3] == trees[1]
+
+def test_rerun_skips_current_weeks(config_path, tmp_path):
+    generator = ContentGenerator(config_path)
+    assert len(generator.generate_all_weeks('blog')) == 8
+    mtimes = {path: path.stat().st_mtime_ns for path in (tmp_path / 'content').rglob('*.*')}
+
+    rerun = ContentGenerator(config_path)
+    assert rerun.generate_all_weeks('blog') == []
+    assert rerun.generate_week(3, 'blog', force=True)
+    assert {path: path.stat().st_mtime_ns for path in mtimes} == mtimes
+
+    # Hash of other inputs: earlier tasks and their output hashes are dropped
+    rerun.manifest.record('other', 'changed', {'elsewhere.json': 'digest'})
+    rerun.manifest.save()
+    assert rerun.manifest.tasks == {'other': ['elsewhere.json']}
+    assert rerun.manifest.outputs == {'elsewhere.json': 'digest'}
+
+@pytest.mark.parametrize('module_count', [1, 5, MODULE_BATCH + 3])
+def test_streamed_week_matches_saved_week(config_path, tmp_path, module_count):
+    generator = ContentGenerator(config_path, formats=('json', 'jsonl'))
+    generator.content_dir = tmp_path / 'saved'
+    content = generator.generate_week_structure(6, 'automation', module_count)
+    saved = generator.save_week_content(6, content, 'automation')
+    generator.content_dir = tmp_path / 'streamed'
+    streamed = generator.stream_week_content(6, 'automation', module_count)
+
+    assert [path.name for path in streamed] == ['modules_automation.json', 'modules_automation.jsonl']
+    for saved_path, streamed_path in zip(saved, streamed):
+        assert streamed_path.read_bytes() == saved_path.read_bytes()
+    assert len(streamed[1].read_text().splitlines()) == module_count
+
+def test_stream_rejects_yaml(config_path):
+    with pytest.raises(ValueError):
+        ContentGenerator(config_path).stream_week_content(1)
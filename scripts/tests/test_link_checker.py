@@ -0,0 +1,140 @@
+"""Tests for link_checker.py against a local stand-in HTTP server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from link_checker import LinkChecker
+
+SLOW_SECONDS = 0.2
+HANG_SECONDS = 1.0
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """/ok answers everything, /head-refused only GET, /missing nothing; /slow/* and /hang take a while."""
+
+    def do_HEAD(self):
+        self.respond('HEAD')
+
+    def do_GET(self):
+        self.respond('GET')
+
+    def respond(self, method):
+        server = self.server
+        with server.lock:
+            server.requests.append((method, self.path))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            if self.path.startswith('/slow/'):
+                time.sleep(SLOW_SECONDS)
+                status = 200
+            elif self.path == '/hang':
+                time.sleep(HANG_SECONDS)
+                status = 200
+            elif self.path == '/head-refused':
+                status = 405 if method == 'HEAD' else 200
+            elif self.path == '/missing':
+                status = 404
+            else:
+                status = 200
+            self.send_response(status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.active = 0
+    httpd.max_active = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.base_url = f'http://127.0.0.1:{httpd.server_address[1]}'
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_head_then_get_fallback(server):
+    checker = LinkChecker()
+    results = checker.check([f'{server.base_url}/ok', f'{server.base_url}/head-refused',
+                             f'{server.base_url}/missing'])
+
+    assert results[f'{server.base_url}/ok']['ok'] is True
+    assert results[f'{server.base_url}/ok']['status'] == 200
+    assert results[f'{server.base_url}/head-refused']['ok'] is True
+    assert results[f'{server.base_url}/head-refused']['status'] == 200
+    assert results[f'{server.base_url}/missing']['ok'] is False
+    assert results[f'{server.base_url}/missing']['status'] == 404
+    assert sorted(server.requests) == [
+        ('GET', '/head-refused'), ('GET', '/missing'),
+        ('HEAD', '/head-refused'), ('HEAD', '/missing'), ('HEAD', '/ok')
+    ]
+
+def test_unreachable_host_is_reported():
+    checker = LinkChecker(timeout=2)
+    # Port 9 (discard) is closed on the loopback interface
+    result = checker.check(['http://127.0.0.1:9/'])['http://127.0.0.1:9/']
+
+    assert result['ok'] is False
+    assert result['status'] is None
+    assert result['error']
+
+def test_per_host_limit(server):
+    checker = LinkChecker(concurrency=20, per_host=2)
+    urls = [f'{server.base_url}/slow/{i}' for i in range(8)]
+    results = checker.check(urls)
+
+    assert all(result['ok'] for result in results.values())
+    # Overlapping slow responses, but never more than two at once
+    assert server.max_active == 2
+
+def test_queued_probes_do_not_time_out(server):
+    # Six rounds of two slow responses take far longer than one probe's timeout
+    checker = LinkChecker(per_host=2, timeout=4 * SLOW_SECONDS)
+    urls = [f'{server.base_url}/slow/{i}' for i in range(12)]
+    results = checker.check(urls)
+
+    assert [url for url, result in results.items() if not result['ok']] == []
+    assert server.max_active == 2
+
+def test_timeouts_are_not_cached(server, tmp_path):
+    cache_path = tmp_path / 'link_cache.json'
+    urls = [f'{server.base_url}/hang', f'{server.base_url}/ok']
+    results = LinkChecker(cache_path, timeout=HANG_SECONDS / 4).check(urls)
+
+    assert (results[urls[0]]['ok'], results[urls[0]]['error']) == (False, 'timed out')
+    assert list(json.loads(cache_path.read_text())) == [urls[1]]
+
+def test_cache_ttl(server, tmp_path):
+    cache_path = tmp_path / 'link_cache.json'
+    url = f'{server.base_url}/ok'
+
+    LinkChecker(cache_path, ttl=60).check([url])
+    assert len(server.requests) == 1
+
+    fresh = LinkChecker(cache_path, ttl=60)
+    assert fresh.check([url])[url]['ok'] is True
+    assert (fresh.cached, fresh.probed) == (1, 0)
+    assert len(server.requests) == 1
+
+    # Age the entry past its TTL; the next check probes the server again
+    entries = json.loads(cache_path.read_text())
+    entries[url]['checked_at'] -= 120
+    cache_path.write_text(json.dumps(entries))
+
+    expired = LinkChecker(cache_path, ttl=60)
+    assert expired.check([url])[url]['ok'] is True
+    assert (expired.cached, expired.probed) == (0, 1)
+    assert len(server.requests) == 2
+    assert json.loads(cache_path.read_text())[url]['checked_at'] > entries[url]['checked_at']
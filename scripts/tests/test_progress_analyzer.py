@@ -0,0 +1,89 @@
+"""Tests for progress code decoding in progress_analyzer.py."""
+
+import pandas as pd
+import pytest
+
+from progress_analyzer import (
+    PROJECT_CODE_MAP, V2_PROJECT_CODES, ProgressAnalyzer, encode_progress_code_v2, generate_checksum,
+    progress_payload
+)
+
+# Canonical, non-canonical and malformed codes, with repeats
+PARITY_CODES = [
+    'HAMPTON-DASH-W3M2-KZ9Z-EYJW',
+    'hampton-blog-w1m5-kz9h-eyjw',
+    '  HAMPTON-AUTO-W8M5-KZ9P-EYJW  ',
+    'HAMPTON-DASH-W3M2-KZ9Z-EYJW',
+    'HAMPTON-DASH-W3M2-XXXX-EYJW',
+    'HAMPTON-TICT-D15L3-KZCJ-EYJW',
+    'HAMPTON-TICT-D1L0-KZCJ-EYJW',
+    'HAMPTON-DASH-W0012M003-KZ9Z-EYJW',
+    'HAMPTON-DASH-W1234M1-KZ9Z-EYJW',
+    'HAMPTON-DASH-WXM1-KZ9Z-EYJW',
+    'HAMPTON-DASH-X1-KZ9Z-EYJW',
+    'HAMPTON-DASH-W1M1-KZ9Z',
+    'NOTHAMPTON-DASH-W1M1-KZ9Z-EYJW',
+    '',
+    'garbage',
+]
+
+PARITY_FIELDS = ('project', 'week', 'module', 'day', 'lesson', 'checksum', 'data', 'checksum_valid',
+                 'xp', 'achievements', 'completed_modules')
+
+@pytest.fixture
+def analyzer(tmp_path):
+    return ProgressAnalyzer(str(tmp_path))
+
+def test_bulk_decoder_matches_scalar(analyzer):
+    codes = PARITY_CODES + [encode_progress_code_v2('SNOW', 3, 2, 500, 1, 12)]
+    bulk = analyzer.decode_progress_codes_bulk(codes)
+    
+    assert len(bulk) == len(codes)
+    for code, (_, row) in zip(codes, bulk.iterrows()):
+        scalar = analyzer.decode_progress_code(code)
+        assert row['valid'] == (scalar is not None), code
+        if scalar is None:
+            continue
+        for field in PARITY_FIELDS:
+            value = None if row[field] is pd.NA else row[field]
+            assert value == scalar[field], (code, field)
+
+@pytest.mark.parametrize('project_code', V2_PROJECT_CODES)
+def test_v2_round_trip(analyzer, project_code):
+    code = encode_progress_code_v2(project_code, 7, 3, 1234, 9, 33)
+    
+    scalar = analyzer.decode_progress_code(code)
+    assert scalar['project'] == PROJECT_CODE_MAP[project_code]
+    assert (scalar['week'], scalar['module']) == (7, 3)
+    assert (scalar['xp'], scalar['achievements'], scalar['completed_modules']) == (1234, 9, 33)
+    assert scalar['checksum_valid']
+    
+    bulk = analyzer.decode_progress_codes_bulk([code]).iloc[0]
+    assert bulk['valid'] and bulk['checksum_valid']
+    assert bulk['project'] == PROJECT_CODE_MAP[project_code]
+    assert (bulk['week'], bulk['module'], bulk['xp']) == (7, 3, 1234)
+
+def test_v1_and_v2_codes_share_project_names(analyzer):
+    codes = []
+    for project_code in PROJECT_CODE_MAP:
+        checksum = generate_checksum(progress_payload(project_code))[:4]
+        codes += [f'HAMPTON-{project_code}-W2M3-{checksum}-EYJW', encode_progress_code_v2(project_code, 2, 3, 500, 1, 8)]
+    
+    analytics = analyzer.analyze_progress_codes(codes)
+    assert analytics['project_distribution'] == {project: 2 for project in PROJECT_CODE_MAP.values()}
+    assert analytics['invalid_checksums'] == 0
+    for code in codes:
+        assert analyzer.decode_progress_code(code)['project'] in PROJECT_CODE_MAP.values()
+
+def test_day_codes_keep_their_own_positions(analyzer):
+    # The React app emits D<day>L<0-based lesson> for the 30-day curricula
+    codes = ['HAMPTON-TICT-D15L3-KZCJ-EYJW', 'HAMPTON-TICT-W2M3-KZCJ-EYJW']
+    
+    scalar = analyzer.decode_progress_code(codes[0])
+    assert (scalar['day'], scalar['lesson'], scalar['week'], scalar['module']) == (15, 4, 0, 0)
+    
+    analytics = analyzer.analyze_progress_codes(codes)
+    assert analytics['week_codes'] == 1
+    assert analytics['average_week'] == 2
+    assert analytics['daily']['codes'] == 1
+    assert analytics['daily']['furthest_progress'] == {'day': 15, 'lesson': 4}